@@ -0,0 +1,98 @@
+"""
+Attention Math - Batched NumPy routines for the attention scenes
+
+All functions work on stacked arrays: the last two axes are (queries, keys) and
+any leading axes (heads, layers, ...) are handled in the same NumPy call, so the
+weights for every head of a multi-head scene come out of a single step.
+"""
+
+import numpy as np
+
+
+def softmax(logits, temperature=1.0, axis=-1, mask=None):
+    """
+    Numerically stable softmax along ``axis``.
+
+    Entries where ``mask`` is False get weight 0 (a fully masked slice is all 0).
+    Temperature 0 gives a one-hot of the argmax instead, as does any slice that
+    contains +inf; the other slices of a stacked input are unaffected.
+
+    >>> softmax([[1.0, 2.0, 3.0], [np.inf, 0.0, 0.0]]).round(3)
+    array([[0.09 , 0.245, 0.665],
+           [1.   , 0.   , 0.   ]])
+    """
+    logits = np.asarray(logits, dtype=float)
+    if mask is not None:
+        logits = np.where(mask, logits, -np.inf)
+
+    empty = np.isneginf(logits).all(axis=axis, keepdims=True)
+    peak = np.max(logits, axis=axis, keepdims=True)
+    if temperature == 0:
+        soft = np.zeros_like(logits)
+        hard = ~empty
+    else:
+        # Shift before scaling so a tiny temperature cannot overflow the exponent
+        with np.errstate(over="ignore", invalid="ignore"):
+            exps = np.exp((logits - np.where(np.isfinite(peak), peak, 0.0)) / temperature)
+            total = exps.sum(axis=axis, keepdims=True)
+            soft = np.divide(exps, total, out=np.zeros_like(exps), where=total > 0)
+        hard = ~np.isfinite(soft).all(axis=axis, keepdims=True)
+
+    hot = np.zeros_like(logits)
+    np.put_along_axis(hot, np.expand_dims(np.argmax(logits, axis=axis), axis), 1.0, axis=axis)
+    # Slices with nothing allowed stay empty
+    return np.where(empty, 0.0, np.where(hard, hot, soft))
+
+
+def causal_mask(n_queries, n_keys=None):
+    """Boolean (n_queries, n_keys) mask letting query i see keys 0..i."""
+    n_keys = n_queries if n_keys is None else n_keys
+    return np.tri(n_queries, n_keys, dtype=bool)
+
+
+def attention_weights(queries, keys, mask=None, causal=False, temperature=1.0):
+    """
+    softmax(Q K^T / sqrt(d)) for (..., n, d) queries and (..., m, d) keys.
+
+    Returns (..., n, m) weights; each query's row sums to 1.
+    """
+    queries = np.asarray(queries, dtype=float)
+    keys = np.asarray(keys, dtype=float)
+    scores = queries @ np.swapaxes(keys, -1, -2) / np.sqrt(queries.shape[-1])
+    if causal:
+        causal = causal_mask(*scores.shape[-2:])
+        mask = causal if mask is None else mask & causal
+    return softmax(scores, temperature=temperature, axis=-1, mask=mask)
+
+
+def scaled_dot_product_attention(queries, keys, values, mask=None, causal=False, temperature=1.0):
+    """Return (output, weights) where output = weights @ values."""
+    weights = attention_weights(queries, keys, mask=mask, causal=causal, temperature=temperature)
+    return weights @ np.asarray(values, dtype=float), weights
+
+
+def positional_encoding(n_positions, d_model, base=10000.0):
+    """
+    Sinusoidal (n_positions, d_model) table from "Attention Is All You Need".
+
+    Dimensions 2i and 2i+1 take sin and cos of pos / base^(2i / d_model).
+    """
+    dims = np.arange(d_model)
+    angles = np.arange(n_positions)[:, np.newaxis] / base ** (2 * (dims // 2) / d_model)
+    return np.where(dims % 2 == 0, np.sin(angles), np.cos(angles))
+
+
+def random_attention(n_tokens, n_heads=None, d_head=16, causal=False, temperature=1.0, rng=None):
+    """
+    Attention weights from random queries and keys.
+
+    With ``n_heads`` the result is (n_heads, n_tokens, n_tokens), computed in one call.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    shape = (n_tokens, d_head) if n_heads is None else (n_heads, n_tokens, d_head)
+    return attention_weights(
+        rng.standard_normal(shape),
+        rng.standard_normal(shape),
+        causal=causal,
+        temperature=temperature,
+    )
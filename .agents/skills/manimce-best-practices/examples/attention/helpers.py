@@ -7,29 +7,162 @@ Contains utility functions and classes for attention visualization.
 
 from manim import *
 import numpy as np
-import warnings
 import random
 import itertools as it
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, Tuple
 
+from attention_math import (
+    attention_weights, causal_mask, positional_encoding, random_attention,
+    scaled_dot_product_attention, softmax
+)
+
+
+# =============================================================================
+# RANDOMNESS
+# =============================================================================
+
+DEFAULT_SEED = 0
+_rng = np.random.default_rng(DEFAULT_SEED)
+
+
+def get_rng(seed=None):
+    """The generator helpers draw from: a fresh one for an explicit seed, else the shared one."""
+    if seed is not None:
+        return np.random.default_rng(seed)
+    return _rng
+
+
+def set_seed(seed=DEFAULT_SEED):
+    """Reseed the shared generator (and ``random`` / ``np.random`` for older code)."""
+    global _rng
+    _rng = np.random.default_rng(seed)
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+@contextmanager
+def random_seed(seed=DEFAULT_SEED):
+    """Draw helper randomness from a generator seeded with ``seed`` inside the block."""
+    global _rng
+    previous, _rng = _rng, np.random.default_rng(seed)
+    try:
+        yield _rng
+    finally:
+        _rng = previous
+
+
+class SeededScene:
+    """
+    Scene mixin that reseeds the helpers before ``construct``.
+
+    Every render then builds identical mobjects, so manim's animation hashes match
+    and partial movies are reused across runs.
+
+        class MyScene(SeededScene, Scene): ...
+    """
+
+    seed = DEFAULT_SEED
+
+    def setup(self):
+        super().setup()
+        set_seed(self.seed)
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def softmax(logits, temperature=1.0):
-    """Numerically stable softmax function."""
-    logits = np.array(logits)
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore')
-        logits = logits - np.max(logits)
-        exps = np.exp(np.divide(logits, temperature, where=temperature != 0))
+class Colormap:
+    """
+    Maps whole arrays of values to (..., 4) RGBA arrays in one NumPy pass.
 
-    if np.isinf(exps).any() or np.isnan(exps).any() or temperature == 0:
-        result = np.zeros_like(logits)
-        result[np.argmax(logits)] = 1
-        return result
-    return exps / np.sum(exps)
+    Values in ``[min_value, max_value]`` run through ``colors``. A diverging map also
+    takes ``negative_colors``: negative values use those instead, with the position
+    taken from their distance to ``min_value`` (as ``value_to_color`` does).
+    """
+
+    def __init__(self, colors, min_value=0.0, max_value=1.0, negative_colors=None, opacity=1.0):
+        self.rgbs = np.array([color_to_rgb(color) for color in colors])
+        self.negative_rgbs = (
+            None if negative_colors is None
+            else np.array([color_to_rgb(color) for color in negative_colors])
+        )
+        self.min_value = min_value
+        self.max_value = max_value
+        self.opacity = opacity
+
+    @classmethod
+    def diverging(
+        cls,
+        max_value=10.0,
+        low_positive_color=BLUE_E,
+        high_positive_color=BLUE_B,
+        low_negative_color=RED_E,
+        high_negative_color=RED_B,
+        **kwargs
+    ):
+        """Blue for positive and red for negative values, brighter with magnitude."""
+        return cls(
+            [low_positive_color, high_positive_color], 0.0, max_value,
+            negative_colors=[low_negative_color, high_negative_color], **kwargs
+        )
+
+    @classmethod
+    def sequential(cls, colors=(BLUE, RED), min_value=-1.0, max_value=1.0, **kwargs):
+        return cls(colors, min_value, max_value, **kwargs)
+
+    def get_alphas(self, values):
+        """Position of each value along the color stops, clipped to [0, 1]."""
+        values = np.asarray(values, dtype=float)
+        if self.max_value == self.min_value:
+            return np.full(values.shape, 0.5)
+        alphas = (values - self.min_value) / (self.max_value - self.min_value)
+        if self.negative_rgbs is not None:
+            alphas = np.abs(alphas)
+        return np.clip(alphas, 0, 1)
+
+    @staticmethod
+    def _interpolate_stops(stops, alphas):
+        if len(stops) == 1:
+            return np.broadcast_to(stops[0], (*alphas.shape, 3)).copy()
+        positions = alphas * (len(stops) - 1)
+        index = np.minimum(positions.astype(int), len(stops) - 2)
+        t = (positions - index)[..., np.newaxis]
+        return stops[index] * (1 - t) + stops[index + 1] * t
+
+    def __call__(self, values, opacity=None):
+        values = np.asarray(values, dtype=float)
+        alphas = self.get_alphas(values)
+        rgbs = self._interpolate_stops(self.rgbs, alphas)
+        if self.negative_rgbs is not None:
+            negative = self._interpolate_stops(self.negative_rgbs, alphas)
+            rgbs = np.where((values < 0)[..., np.newaxis], negative, rgbs)
+        opacities = np.broadcast_to(self.opacity if opacity is None else opacity, values.shape)
+        return np.concatenate([rgbs, opacities[..., np.newaxis]], axis=-1)
+
+
+def set_fill_by_values(mobjects, values, colormap, opacity=None):
+    """Color the fill of each mobject from its value with one colormap call."""
+    rgbas = colormap(np.ravel(values), opacity)
+    for mob, rgba in zip(mobjects, rgbas):
+        for sm in mob.get_family():
+            sm.fill_rgbas = rgba[np.newaxis].copy()
+            sm.fill_opacity = rgba[3]
+    return mobjects
+
+
+def set_stroke_by_values(mobjects, values, colormap, widths=None, opacity=None):
+    """Color (and optionally resize) the stroke of each mobject from its value."""
+    rgbas = colormap(np.ravel(values), opacity)
+    widths = it.repeat(None) if widths is None else np.ravel(widths)
+    for mob, rgba, width in zip(mobjects, rgbas, widths):
+        for sm in mob.get_family():
+            sm.stroke_rgbas = rgba[np.newaxis].copy()
+            if width is not None:
+                sm.stroke_width = width
+    return mobjects
 
 
 def value_to_color(
@@ -42,40 +175,200 @@ def value_to_color(
     max_value=10.0
 ):
     """Map a numeric value to a color based on sign and magnitude."""
-    # Clamp alpha between 0 and 1
-    alpha = max(0, min(1, abs(value - min_value) / (max_value - min_value))) if max_value != min_value else 0.5
+    colormap = Colormap(
+        [low_positive_color, high_positive_color], min_value, max_value,
+        negative_colors=[low_negative_color, high_negative_color]
+    )
+    return rgb_to_color(colormap(value)[:3])
 
-    if value >= 0:
-        return interpolate_color(low_positive_color, high_positive_color, alpha)
-    else:
-        return interpolate_color(low_negative_color, high_negative_color, alpha)
-
-
-def get_paragraph(words, line_len=40, font_size=48):
-    """Handle word wrapping for text display."""
-    words = list(map(str.strip, words))
-    word_lens = list(map(len, words))
-    lines = []
-    lh, rh = 0, 0
-    while rh < len(words):
-        rh += 1
-        if sum(word_lens[lh:rh]) > line_len:
-            rh -= 1
-            lines.append(words[lh:rh])
-            lh = rh
-    lines.append(words[lh:])
-    text = "\n".join([" ".join(line).strip() for line in lines])
-    return Text(text, font_size=font_size)
-
-
-def random_bright_color(hue_range=(0.0, 1.0)):
+
+@lru_cache(maxsize=None)
+def text_width(text, font="", font_size=48):
+    """Width of ``text`` typeset with Text, measured once per (text, font, size)."""
+    return Text(text, font=font, font_size=font_size).width
+
+
+@lru_cache(maxsize=None)
+def glyph_advance(char, font="", font_size=48):
+    """
+    Horizontal advance of ``char``, including its side bearings.
+
+    Measured as the growth of a bracketing string, so spaces get a width too.
+    """
+    return text_width(f"H{char}H", font, font_size) - text_width("HH", font, font_size)
+
+
+@lru_cache(maxsize=4096)
+def word_width(word, font="", font_size=48):
+    """Width of a word as the sum of its glyph advances."""
+    return sum(glyph_advance(char, font, font_size) for char in word)
+
+
+def wrap_words(widths, line_width, space_width=0.0):
+    """
+    Greedily split words into lines no wider than ``line_width``.
+
+    Returns the index where each line starts. With prefix sums every line end is
+    a single binary search, and a word wider than a line gets a line of its own.
+    """
+    widths = np.asarray(widths, dtype=float)
+    # offsets[j] is the width of words[:j] plus one space per word
+    offsets = np.concatenate([[0.0], np.cumsum(widths + space_width)])
+    starts = []
+    start = 0
+    while start < len(widths):
+        starts.append(start)
+        limit = offsets[start] + line_width + space_width
+        end = np.searchsorted(offsets, limit, side="right") - 1
+        start = max(int(end), start + 1)
+    return starts
+
+
+def get_paragraph(words, line_len=40, font_size=48, line_width=None, font=""):
+    """
+    Handle word wrapping for text display.
+
+    Words are measured with the font's glyph advances. ``line_width`` is in scene
+    units; without it a line holds about ``line_len`` characters of the font.
+    """
+    if isinstance(words, str):
+        words = words.split()
+    words = [word for word in map(str.strip, words) if word]
+    if line_width is None:
+        line_width = line_len * glyph_advance("n", font, font_size)
+
+    widths = [word_width(word, font, font_size) for word in words]
+    starts = wrap_words(widths, line_width, glyph_advance(" ", font, font_size))
+    lines = [
+        " ".join(words[start:end])
+        for start, end in zip(starts, starts[1:] + [len(words)])
+    ]
+    return Text("\n".join(lines), font=font, font_size=font_size)
+
+
+def random_bright_color(hue_range=(0.0, 1.0), seed=None):
     """Generate a random bright color within a hue range."""
     import colorsys
-    hue = random.uniform(*hue_range)
+    hue = get_rng(seed).uniform(*hue_range)
     rgb = colorsys.hsv_to_rgb(hue, 0.7, 0.9)
     return rgb_to_color(rgb)
 
 
+# =============================================================================
+# GLYPH ATLAS
+# =============================================================================
+
+class GlyphAtlas:
+    """
+    Typesets each character once and lays out numbers by copying glyph outlines.
+
+    Numbers built from an atlas are single VMobjects, so a matrix with thousands of
+    entries costs one LaTeX call per distinct character instead of one per digit.
+    Spacing and sign placement follow DecimalNumber.
+    """
+
+    def __init__(self, font_size=24, digit_buff_per_font_unit=0.001):
+        self.font_size = font_size
+        self.buff = digit_buff_per_font_unit * font_size
+        self.glyphs = {}
+        self.layouts = {}
+        self.symbols = {}
+        self.digit_height = self.glyph("0")[2]
+
+    def glyph(self, char):
+        """Return (points, width, height) of a character with its lower-left corner at the origin."""
+        if char not in self.glyphs:
+            mob = MathTex(char, font_size=self.font_size)
+            points = np.vstack([sm.points for sm in mob.family_members_with_points()])
+            low, high = points.min(axis=0), points.max(axis=0)
+            self.glyphs[char] = (points - [low[0], low[1], 0], high[0] - low[0], high[1] - low[1])
+        return self.glyphs[char]
+
+    def layout(self, string):
+        """Return the points of ``string`` typeset on one baseline, and its height."""
+        if string not in self.layouts:
+            pieces = []
+            x = 0.0
+            for char in string:
+                points, width, height = self.glyph(char)
+                if char in "+-":
+                    y = (self.digit_height - height) / 2
+                elif char == ",":
+                    y = -height / 2
+                else:
+                    y = 0.0
+                pieces.append(points + [x, y, 0])
+                x += width + self.buff
+            points = np.vstack(pieces)
+            self.layouts[string] = (points, np.ptp(points[:, 1]))
+        return self.layouts[string]
+
+    def symbol(self, tex):
+        """Return a copy of a typeset symbol such as ``\\vdots`` or a bracket."""
+        if tex not in self.symbols:
+            self.symbols[tex] = MathTex(tex, font_size=self.font_size)
+        return self.symbols[tex].copy()
+
+    @staticmethod
+    def format(number, num_decimal_places=1, include_sign=False):
+        """Format a number the way DecimalNumber does."""
+        string = f"{number:{'+' if include_sign else ''},.{num_decimal_places}f}"
+        if string.lstrip("+-").strip("0.,") == "":
+            string = string.replace("-", "+" if include_sign else "")
+        return string
+
+
+@lru_cache(maxsize=None)
+def get_glyph_atlas(font_size=24):
+    """Shared atlas per font size."""
+    return GlyphAtlas(font_size)
+
+
+class GlyphNumber(VMobject):
+    """
+    A DecimalNumber drop-in drawn from a shared GlyphAtlas as a single VMobject.
+    ``set_value`` only replaces the points when the displayed string changes.
+    """
+
+    def __init__(
+        self,
+        number=0,
+        num_decimal_places=1,
+        include_sign=False,
+        font_size=24,
+        **kwargs
+    ):
+        super().__init__(stroke_width=0, fill_opacity=1.0, **kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.include_sign = include_sign
+        # Only the font size is stored so that copies share the atlas
+        self.atlas_font_size = font_size
+        self.number = number
+        self.string = self.atlas.format(number, num_decimal_places, include_sign)
+        self.set_points(self.atlas.layout(self.string)[0])
+        self.center()
+
+    @property
+    def atlas(self):
+        return get_glyph_atlas(self.atlas_font_size)
+
+    def get_value(self):
+        return self.number
+
+    def set_value(self, number):
+        self.number = number
+        string = self.atlas.format(number, self.num_decimal_places, self.include_sign)
+        if string == self.string:
+            return self
+        old_height = self.atlas.layout(self.string)[1]
+        scale = self.height / old_height if old_height else 1.0
+        left = self.get_left()
+        self.string = string
+        self.set_points(self.atlas.layout(string)[0] * scale)
+        self.move_to(left, aligned_edge=LEFT)
+        return self
+
+
 # =============================================================================
 # CUSTOM MOBJECT CLASSES
 # =============================================================================
@@ -84,6 +377,11 @@ class NumericEmbedding(VGroup):
     """
     A vertical vector of decimal numbers representing an embedding.
     Displays values with color coding based on magnitude.
+
+    Numbers come from the shared glyph atlas and the brackets and ellipsis are
+    copies of symbols typeset once per font size, so building many embeddings
+    only costs layout work. ``max_shown`` shows a long vector through its leading
+    values and the last one around the ellipsis.
     """
 
     def __init__(
@@ -94,9 +392,12 @@ class NumericEmbedding(VGroup):
         value_range: Tuple[float, float] = (-9.9, 9.9),
         show_ellipsis: bool = True,
         ellipsis_row: int = -2,
+        max_shown: Optional[int] = None,
+        font_size: float = 36,
         dark_color=GREY_C,
         light_color=WHITE,
         bracket_color=GREY_B,
+        seed=None,
         **kwargs
     ):
         super().__init__(**kwargs)
@@ -106,33 +407,42 @@ class NumericEmbedding(VGroup):
         self.light_color = light_color
 
         if values is None:
-            values = np.random.uniform(*value_range, size=length)
+            values = get_rng(seed).uniform(*value_range, size=length)
 
-        self.values = values
-        self.length = len(values)
+        self.values = np.array(values, dtype=float)
+        self.length = len(self.values)
+        self.indices = shown_indices(self.length, max_shown, show_ellipsis, ellipsis_row)
 
         # Create decimal number entries
+        symbols = get_glyph_atlas(DEFAULT_FONT_SIZE)
+        self.numbers = VGroup()
         self.elements = VGroup()
-        for i, val in enumerate(values):
-            if show_ellipsis and i == (ellipsis_row % len(values)):
-                entry = MathTex(r"\vdots")
+        for index in self.indices:
+            if index is None:
+                entry = symbols.symbol(r"\vdots")
             else:
-                entry = DecimalNumber(
-                    val,
+                entry = GlyphNumber(
+                    self.values[index],
                     num_decimal_places=num_decimal_places,
                     include_sign=True,
-                    font_size=36
+                    font_size=font_size
                 )
-                # Color based on value
-                alpha = abs(val) / max(abs(value_range[0]), abs(value_range[1]))
-                entry.set_color(interpolate_color(dark_color, light_color, alpha))
+                self.numbers.add(entry)
             self.elements.add(entry)
 
+        # Color based on magnitude
+        max_abs = max(abs(value_range[0]), abs(value_range[1]))
+        self.colormap = Colormap(
+            [dark_color, light_color], 0, max_abs, negative_colors=[dark_color, light_color]
+        )
+        shown = self.values[[index for index in self.indices if index is not None]]
+        set_fill_by_values(self.numbers, shown, self.colormap)
+
         self.elements.arrange(DOWN, buff=0.15)
 
         # Add brackets
-        self.left_bracket = MathTex(r"\left[")
-        self.right_bracket = MathTex(r"\right]")
+        self.left_bracket = symbols.symbol(r"\left[")
+        self.right_bracket = symbols.symbol(r"\right]")
 
         self.left_bracket.stretch_to_fit_height(self.elements.get_height() * 1.1)
         self.right_bracket.stretch_to_fit_height(self.elements.get_height() * 1.1)
@@ -151,11 +461,35 @@ class NumericEmbedding(VGroup):
     def get_entries(self):
         return self.elements
 
+    def get_numbers(self):
+        return self.numbers
+
+
+def shown_indices(n, max_shown=None, show_ellipsis=True, ellipsis_index=-2):
+    """
+    Map display slots to array indices, with ``None`` for the ellipsis slot.
+
+    Slots before the ellipsis show the leading entries and slots after it show the
+    trailing ones, so hidden entries are never looked at.
+    """
+    n_slots = n if max_shown is None else min(n, max_shown)
+    if not show_ellipsis:
+        return list(range(n_slots))
+    ellipsis_slot = ellipsis_index % n_slots
+    return [
+        slot if slot < ellipsis_slot else None if slot == ellipsis_slot else n - (n_slots - slot)
+        for slot in range(n_slots)
+    ]
+
 
 class WeightMatrix(VGroup):
     """
     A matrix of decimal numbers with color-coded entries.
     Used to represent weight matrices in neural networks.
+
+    Values live in a NumPy array and only the visible cells are built, each as one
+    GlyphNumber from a shared atlas. ``max_shown=(rows, cols)`` shows a large matrix
+    through its leading rows/columns and the last one around the ellipses.
     """
 
     def __init__(
@@ -167,62 +501,88 @@ class WeightMatrix(VGroup):
         show_ellipsis: bool = True,
         ellipsis_row: int = -2,
         ellipsis_col: int = -2,
+        max_shown: Optional[Tuple[int, int]] = None,
+        font_size: float = 24,
+        h_buff: float = 0.2,
+        v_buff: float = 0.15,
         low_positive_color=BLUE_E,
         high_positive_color=BLUE_B,
         low_negative_color=RED_E,
         high_negative_color=RED_B,
+        seed=None,
         **kwargs
     ):
         super().__init__(**kwargs)
 
-        self.shape = shape
         self.value_range = value_range
+        self.num_decimal_places = num_decimal_places
         self.low_positive_color = low_positive_color
         self.high_positive_color = high_positive_color
         self.low_negative_color = low_negative_color
         self.high_negative_color = high_negative_color
+        self.colormap = Colormap.diverging(
+            max(abs(value_range[0]), abs(value_range[1])),
+            low_positive_color,
+            high_positive_color,
+            low_negative_color,
+            high_negative_color,
+        )
 
         if values is None:
-            values = np.random.uniform(*value_range, size=shape)
-
-        self.values = values
+            values = get_rng(seed).uniform(*value_range, size=shape)
+
+        self.values = np.array(values, dtype=float)
+        self.shape = self.values.shape
+
+        # Work out which cells are visible
+        n_rows, n_cols = self.shape
+        max_rows, max_cols = max_shown if max_shown is not None else (None, None)
+        self.row_indices = shown_indices(n_rows, max_rows, show_ellipsis, ellipsis_row)
+        self.col_indices = shown_indices(n_cols, max_cols, show_ellipsis, ellipsis_col)
+        self.entry_indices = [
+            (i, j)
+            for i in self.row_indices if i is not None
+            for j in self.col_indices if j is not None
+        ]
 
         # Create matrix entries
-        self.rows = VGroup()
-        n_rows, n_cols = shape
+        atlas = get_glyph_atlas(font_size)
+        self.entries = VGroup(*[
+            GlyphNumber(
+                self.values[i, j],
+                num_decimal_places=num_decimal_places,
+                include_sign=True,
+                font_size=font_size
+            )
+            for i, j in self.entry_indices
+        ])
+        self.color_entries()
 
-        for i in range(n_rows):
+        entries = iter(self.entries)
+        self.rows = VGroup()
+        for i in self.row_indices:
             row = VGroup()
-            for j in range(n_cols):
-                if show_ellipsis and i == (ellipsis_row % n_rows):
-                    entry = MathTex(r"\vdots")
-                elif show_ellipsis and j == (ellipsis_col % n_cols):
-                    entry = MathTex(r"\cdots")
+            for j in self.col_indices:
+                if i is None:
+                    row.add(atlas.symbol(r"\vdots"))
+                elif j is None:
+                    row.add(atlas.symbol(r"\cdots"))
                 else:
-                    val = values[i, j]
-                    entry = DecimalNumber(
-                        val,
-                        num_decimal_places=num_decimal_places,
-                        include_sign=True,
-                        font_size=24
-                    )
-                    entry.set_color(value_to_color(
-                        val,
-                        low_positive_color,
-                        high_positive_color,
-                        low_negative_color,
-                        high_negative_color,
-                        0, max(abs(value_range[0]), abs(value_range[1]))
-                    ))
-                row.add(entry)
-            row.arrange(RIGHT, buff=0.2)
+                    row.add(next(entries))
             self.rows.add(row)
 
-        self.rows.arrange(DOWN, buff=0.15)
+        # Place cells on a grid of equal columns in one pass
+        cells = [cell for row in self.rows for cell in row]
+        col_width = max(cell.width for cell in cells) + h_buff
+        row_height = max(cell.height for cell in cells) + v_buff
+        for r, row in enumerate(self.rows):
+            for c, cell in enumerate(row):
+                cell.move_to([c * col_width, -r * row_height, 0])
+        self.rows.center()
 
         # Add brackets
-        self.left_bracket = MathTex(r"\left[")
-        self.right_bracket = MathTex(r"\right]")
+        self.left_bracket = atlas.symbol(r"\left[")
+        self.right_bracket = atlas.symbol(r"\right]")
 
         self.left_bracket.stretch_to_fit_height(self.rows.get_height() * 1.1)
         self.right_bracket.stretch_to_fit_height(self.rows.get_height() * 1.1)
@@ -233,21 +593,37 @@ class WeightMatrix(VGroup):
         self.add(self.left_bracket, self.rows, self.right_bracket)
 
     def get_entries(self):
-        entries = VGroup()
-        for row in self.rows:
-            for entry in row:
-                if isinstance(entry, DecimalNumber):
-                    entries.add(entry)
-        return entries
+        return self.entries
 
     def get_rows(self):
         return self.rows
 
+    def get_shown_values(self):
+        """Values of the visible entries, in the order of ``get_entries``."""
+        rows, cols = zip(*self.entry_indices) if self.entry_indices else ((), ())
+        return self.values[list(rows), list(cols)]
 
-class ContextAnimation(LaggedStart):
+    def color_entries(self):
+        """Color every visible entry from its value in one colormap call."""
+        set_fill_by_values(self.entries, self.get_shown_values(), self.colormap)
+        return self
+
+    def set_values(self, values):
+        """Replace the whole values array, updating only the visible entries."""
+        self.values = np.array(values, dtype=float).reshape(self.shape)
+        for entry, value in zip(self.entries, self.get_shown_values()):
+            entry.set_value(value)
+        return self.color_entries()
+
+
+class ContextAnimation(Animation):
     """
     Animation showing context flow from source words to target word.
     Creates arcing lines that flash from sources to target.
+
+    The arcs are ConnectionLayers (one per bending direction) and all of them share
+    one flash window, so each frame is one array update however many sources
+    there are.
     """
 
     def __init__(
@@ -261,42 +637,291 @@ class ContextAnimation(LaggedStart):
         strengths=None,
         run_time=3,
         path_arc=PI / 2,
+        hue_range=(0.1, 0.3),
+        seed=None,
         **kwargs,
     ):
-        arcs = VGroup()
+        rng = get_rng(seed)
         if strengths is None:
-            strengths = np.random.random(len(sources)) ** 2
+            strengths = rng.random(len(sources)) ** 2
+        strengths = np.asarray(strengths, dtype=float)
+        self.time_width = time_width
+
+        starts = np.array([source.get_edge_center(direction) for source in sources]).reshape(-1, 3)
+        end = target.get_edge_center(direction)
+        signs = direction[1] * (-1) ** (starts[:, 0] < target.get_x()).astype(int)
+
+        # Random bright colors, as random_bright_color would pick them
+        import colorsys
+        colormap = Colormap([
+            rgb_to_color(colorsys.hsv_to_rgb(hue, 0.7, 0.9))
+            for hue in np.linspace(*hue_range, 5)
+        ])
+        values = rng.random(len(starts))
+        widths = interpolate(min_stroke_width, max_stroke_width, strengths)
 
-        for source, strength in zip(sources, strengths):
-            sign = direction[1] * (-1) ** int(source.get_x() < target.get_x())
-            arc = Line(
-                source.get_edge_center(direction),
-                target.get_edge_center(direction),
+        arcs = VGroup()
+        for sign in np.unique(signs):
+            mask = signs == sign
+            arcs.add(ConnectionLayer(
+                starts[mask],
+                np.repeat([end], mask.sum(), axis=0),
+                values=values[mask],
+                widths=widths[mask],
+                colormap=colormap,
+                max_stroke_width=max_stroke_width,
                 path_arc=sign * path_arc,
+            ))
+        self.endpoints = [layer.get_endpoints() for layer in arcs]
+
+        super().__init__(arcs, run_time=run_time, remover=True, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        # Same window as ShowPassingFlash
+        alpha = self.rate_func(alpha)
+        upper = interpolate(0, 1 + self.time_width, alpha)
+        lower = max(upper - self.time_width, 0)
+        upper = min(upper, 1)
+        for layer, (starts, ends) in zip(self.mobject, self.endpoints):
+            layer.set_template(arc_window(layer.path_arc, lower, upper), starts, ends)
+
+    def clean_up_from_scene(self, scene: Scene) -> None:
+        super().clean_up_from_scene(scene)
+        for layer, (starts, ends) in zip(self.mobject, self.endpoints):
+            layer.set_template(arc_template(layer.path_arc), starts, ends)
+
+
+@lru_cache(maxsize=256)
+def arc_template(path_arc=0.0, n_components=8):
+    """
+    Bezier control points of a path from 0 to 1 in the complex plane.
+
+    ``path_arc`` is the angle the path turns through, as in ``Line(path_arc=...)``;
+    0 gives a straight cubic segment. Only full paths are cached (one per angle);
+    use ``arc_window`` for a portion. Results are read-only.
+    """
+    template = arc_window(path_arc, 0.0, 1.0, n_components)
+    template.setflags(write=False)
+    return template
+
+
+def arc_window(path_arc=0.0, start=0.0, end=1.0, n_components=8):
+    """
+    The ``start``..``end`` portion of ``arc_template(path_arc)``.
+
+    A part of an arc is again an arc, so it is computed directly, with the same
+    number of points as the full path. Not cached: windows change every frame.
+    """
+    if path_arc == 0:
+        return np.linspace(start, end, 4).astype(complex)
+    center = 0.5 + 0.5j / np.tan(path_arc / 2)
+    angles = np.angle(-center) + path_arc * np.linspace(start, end, n_components + 1)
+    anchors = center + abs(center) * np.exp(1j * angles)
+    # Handles along the tangents, 4/3 tan(theta/4) of the radius away
+    handle = 4 / 3 * np.tan(path_arc * (end - start) / n_components / 4) * 1j
+    starts, ends = anchors[:-1], anchors[1:]
+    return np.column_stack([
+        starts,
+        starts + handle * (starts - center),
+        ends - handle * (ends - center),
+        ends,
+    ]).ravel()
+
+
+def map_template(template, starts, ends):
+    """
+    Place a copy of ``template`` between each start and end point.
+
+    The template is rotated and scaled in the xy-plane; z is interpolated linearly.
+    Returns an (n, len(template), 3) array.
+    """
+    delta = ends - starts
+    re, im = template.real, template.imag
+    return np.stack([
+        starts[:, [0]] + re * delta[:, [0]] - im * delta[:, [1]],
+        starts[:, [1]] + re * delta[:, [1]] + im * delta[:, [0]],
+        starts[:, [2]] + re * delta[:, [2]],
+    ], axis=-1)
+
+
+class ConnectionBucket(VMobject):
+    """
+    Connections drawn as one VMobject, each ``path_length`` points long.
+
+    VMobject only starts a new subpath where a curve does not begin at the previous
+    one's end, so two connections meeting at a neuron would merge into one path.
+    Here every ``path_length`` points also start a new subpath.
+    """
+
+    def __init__(self, path_length=4, **kwargs):
+        super().__init__(**kwargs)
+        self.path_length = path_length
+
+    def _gen_subpaths_from_points(self, points, filter_func):
+        stride = self.path_length
+        return super()._gen_subpaths_from_points(
+            points, lambda n: n % stride == 0 or filter_func(n)
+        )
+
+
+class ConnectionLayer(VGroup):
+    """
+    All connections between two layers, stored as contiguous arrays.
+
+    Each connection has a value (mapped through ``colormap``), a stroke width and an
+    opacity. Connections whose quantized color, width and opacity match share one
+    VMobject of disjoint subpaths (straight, or arcs for a nonzero ``path_arc``), so
+    the mobject count and per-frame cost depend on ``levels`` rather than on the
+    number of connections. Call ``set_weights`` (or play ``AnimateWeights``) to
+    change the arrays, or ``set_connections`` to replace the connections.
+    """
+
+    def __init__(
+        self,
+        starts,
+        ends,
+        values=None,
+        widths=None,
+        opacities=None,
+        colormap=None,
+        max_stroke_width=2.0,
+        levels=8,
+        path_arc=0.0,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.colormap = colormap if colormap is not None else Colormap.diverging()
+        self.max_stroke_width = max_stroke_width
+        self.levels = levels
+        self.path_arc = path_arc
+        self.template = arc_template(path_arc)
+        self.set_connections(starts, ends, values, widths, opacities)
+
+    def set_connections(self, starts, ends, values=None, widths=None, opacities=None):
+        """Replace all connections (their number may change)."""
+        n = len(starts)
+        self.values = np.zeros(n) if values is None else np.array(values, dtype=float)
+        self.widths = np.full(n, self.max_stroke_width) if widths is None else np.array(widths, dtype=float)
+        self.opacities = np.ones(n) if opacities is None else np.array(opacities, dtype=float)
+        return self.bucket_segments(
+            np.asarray(starts, dtype=float).reshape(n, 3),
+            np.asarray(ends, dtype=float).reshape(n, 3)
+        )
+
+    def get_endpoints(self):
+        """
+        Current (starts, ends) in connection order, following any transforms.
+
+        The endpoints are read back from the bucket points, since a transform of a
+        parent group moves those points without going through the layer. That needs
+        the layout written by ``set_template``; if something else rewrote the points
+        (a ``Transform`` into another mobject, ``align_points``, ``set_points`` on a
+        bucket), a ValueError is raised instead of returning scrambled endpoints.
+        """
+        n = len(self.order)
+        if n == 0:
+            return np.zeros((0, 3)), np.zeros((0, 3))
+        sizes = [len(bucket.points) for bucket in self.submobjects]
+        expected = list(self.bucket_sizes * len(self.template))
+        strides = {getattr(bucket, "path_length", None) for bucket in self.submobjects}
+        if sizes != expected or strides != {len(self.template)}:
+            raise ValueError(
+                f"ConnectionLayer buckets hold {sum(sizes)} points in {len(sizes)} buckets "
+                f"but set_template wrote {sum(expected)} in {len(expected)} (or in another "
+                "split); the points were replaced outside the layer, so the "
+                "connections can no longer be recovered. Call set_connections with "
+                "explicit endpoints instead."
             )
-            arc.set_stroke(
-                color=random_bright_color(hue_range=(0.1, 0.3)),
-                width=interpolate(min_stroke_width, max_stroke_width, strength)
-            )
-            arcs.add(arc)
-
-        arcs.shuffle()
-        lag_ratio = 0.5 / max(len(arcs), 1)
-
-        super().__init__(
-            *[
-                ShowPassingFlash(arc, time_width=time_width)
-                for arc in arcs
-            ],
-            lag_ratio=lag_ratio,
-            run_time=run_time,
-            **kwargs,
+        points = np.vstack([bucket.points for bucket in self.submobjects])
+        points = points.reshape(n, len(self.template), 3)
+        paths = np.empty_like(points)
+        paths[self.order] = points
+        return paths[:, 0], paths[:, -1]
+
+    def set_weights(self, values=None, widths=None, opacities=None):
+        """Update any of the arrays in place and regroup the connections."""
+        starts, ends = self.get_endpoints()
+        if values is not None:
+            self.values[:] = values
+        if widths is not None:
+            self.widths[:] = widths
+        if opacities is not None:
+            self.opacities[:] = opacities
+        return self.bucket_segments(starts, ends)
+
+    def bucket_segments(self, starts, ends):
+        # Group by sign, colormap position, opacity and width, each quantized to `levels`
+        steps = self.levels - 1
+        opacities = np.clip(self.opacities, 0, 1)
+        keys = np.column_stack([
+            self.values < 0,
+            np.rint(self.colormap.get_alphas(self.values) * steps),
+            np.rint(opacities * steps),
+            np.rint(np.clip(self.widths / self.max_stroke_width, 0, 1) * steps),
+        ]).astype(np.int64)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        self.order = np.argsort(inverse, kind="stable")
+        self.bucket_sizes = np.bincount(inverse, minlength=len(unique_keys))
+
+        # Each bucket is drawn with the mean color and width of its connections
+        rgbas = self.colormap(self.values, opacities)
+        counts = np.maximum(self.bucket_sizes, 1)
+        bucket_rgbas = np.column_stack([
+            np.bincount(inverse, rgbas[:, k], len(unique_keys)) for k in range(4)
+        ]) / counts[:, np.newaxis]
+        bucket_widths = np.bincount(inverse, self.widths, len(unique_keys)) / counts
+
+        buckets = self.submobjects[:len(unique_keys)]
+        while len(buckets) < len(unique_keys):
+            buckets.append(ConnectionBucket(fill_opacity=0))
+        for bucket, rgba, width in zip(buckets, bucket_rgbas, bucket_widths):
+            bucket.stroke_rgbas = rgba[np.newaxis]
+            bucket.stroke_width = width
+        self.submobjects = buckets
+        return self.set_template(self.template, starts, ends)
+
+    def set_template(self, template, starts=None, ends=None):
+        """
+        Redraw every connection along ``template`` in one array operation.
+
+        Pass the full-path ``starts``/``ends`` when the current template is partial,
+        since ``get_endpoints`` then returns the partial endpoints.
+        """
+        if starts is None:
+            starts, ends = self.get_endpoints()
+        points = map_template(template, starts[self.order], ends[self.order]).reshape(-1, 3)
+        offsets = np.concatenate([[0], np.cumsum(self.bucket_sizes)]) * len(template)
+        for bucket, lo, hi in zip(self.submobjects, offsets[:-1], offsets[1:]):
+            bucket.set_points(points[lo:hi])
+            bucket.path_length = len(template)
+        self.template = template
+        return self
+
+
+class AnimateWeights(Animation):
+    """Interpolate a ConnectionLayer's value, width and opacity arrays toward targets."""
+
+    def __init__(self, layer, values=None, widths=None, opacities=None, **kwargs):
+        self.starts = (layer.values.copy(), layer.widths.copy(), layer.opacities.copy())
+        self.targets = tuple(
+            start if target is None else np.asarray(target, dtype=float)
+            for start, target in zip(self.starts, (values, widths, opacities))
         )
+        super().__init__(layer, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        self.mobject.set_weights(*(
+            interpolate(start, target, alpha)
+            for start, target in zip(self.starts, self.targets)
+        ))
 
 
 class NeuralNetwork(VGroup):
     """
     Visual representation of a neural network with layers and connections.
+    Connections between each pair of layers form one ConnectionLayer.
     """
 
     def __init__(
@@ -306,17 +931,19 @@ class NeuralNetwork(VGroup):
         v_buff=0.3,
         h_buff=1.5,
         max_stroke_width=2.0,
+        seed=None,
         **kwargs
     ):
         super().__init__(**kwargs)
 
         self.max_stroke_width = max_stroke_width
+        rng = get_rng(seed)
 
         # Create layers
         self.layers = VGroup()
         for n in layer_sizes:
             layer = VGroup(*[
-                Circle(radius=neuron_radius, color=WHITE, fill_opacity=random.random())
+                Circle(radius=neuron_radius, color=WHITE, fill_opacity=rng.random())
                 for _ in range(n)
             ])
             layer.arrange(DOWN, buff=v_buff)
@@ -324,32 +951,55 @@ class NeuralNetwork(VGroup):
 
         self.layers.arrange(RIGHT, buff=h_buff)
 
-        # Create connections
+        # Create connections, shortened by the neuron radius at both ends
         self.lines = VGroup()
         for l1, l2 in zip(self.layers, self.layers[1:]):
-            layer_lines = VGroup()
-            for n1 in l1:
-                for n2 in l2:
-                    line = Line(
-                        n1.get_center(),
-                        n2.get_center(),
-                        buff=neuron_radius
-                    )
-                    line.set_stroke(
-                        color=value_to_color(random.uniform(-10, 10)),
-                        width=max_stroke_width * random.random(),
-                        opacity=random.random() ** 2
-                    )
-                    layer_lines.add(line)
-            self.lines.add(layer_lines)
+            c1 = np.array([neuron.get_center() for neuron in l1])
+            c2 = np.array([neuron.get_center() for neuron in l2])
+            starts = np.repeat(c1, len(c2), axis=0)
+            ends = np.tile(c2, (len(c1), 1))
+            unit = (ends - starts) / np.linalg.norm(ends - starts, axis=1, keepdims=True)
+            n_lines = len(starts)
+            self.lines.add(ConnectionLayer(
+                starts + neuron_radius * unit,
+                ends - neuron_radius * unit,
+                values=rng.uniform(-10, 10, n_lines),
+                widths=max_stroke_width * rng.random(n_lines),
+                opacities=rng.random(n_lines) ** 2,
+                max_stroke_width=max_stroke_width,
+            ))
 
         self.add(self.lines, self.layers)
 
 
+def select_attention(weights, top_k=None, threshold=None):
+    """
+    Pick the (rows, cols) of the attention weights worth drawing.
+
+    ``top_k`` keeps each query's k largest weights (``np.argpartition``, no full
+    sort); ``threshold`` then drops weights at or below it.
+    """
+    weights = np.asarray(weights)
+    n_rows, n_cols = weights.shape
+    if top_k is not None and top_k < n_cols:
+        cols = np.argpartition(-weights, top_k - 1, axis=1)[:, :top_k].ravel()
+        rows = np.repeat(np.arange(n_rows), top_k)
+    else:
+        rows, cols = np.indices(weights.shape).reshape(2, -1)
+    if threshold is not None:
+        keep = weights[rows, cols] > threshold
+        rows, cols = rows[keep], cols[keep]
+    return rows, cols
+
+
 class AttentionPattern(VGroup):
     """
     Visual representation of attention weights between tokens.
     Shows which tokens attend to which with varying line widths.
+
+    Arcs are selected with vectorized top-k / threshold selection and drawn as one
+    ConnectionLayer. ``set_attention_weights`` swaps in a new weight matrix, e.g.
+    from an updater between animation steps.
     """
 
     def __init__(
@@ -357,16 +1007,26 @@ class AttentionPattern(VGroup):
         n_tokens=8,
         token_labels=None,
         attention_weights=None,
+        threshold=0.1,
+        top_k=None,
+        path_arc=-0.5,
+        max_stroke_width=5,
+        seed=None,
         **kwargs
     ):
         super().__init__(**kwargs)
 
+        self.threshold = threshold
+        self.top_k = top_k
+
         if token_labels is None:
             token_labels = [f"T{i}" for i in range(n_tokens)]
 
         if attention_weights is None:
             # Random attention pattern
-            attention_weights = softmax(np.random.randn(n_tokens, n_tokens), temperature=0.5)
+            attention_weights = softmax(
+                get_rng(seed).standard_normal((n_tokens, n_tokens)), temperature=0.5
+            )
 
         # Create token representations
         self.tokens = VGroup()
@@ -380,59 +1040,328 @@ class AttentionPattern(VGroup):
 
         self.tokens.arrange(RIGHT, buff=0.5)
 
-        # Create attention lines (simplified - just showing strongest connections)
-        self.attention_lines = VGroup()
-        for i in range(n_tokens):
-            for j in range(n_tokens):
-                if attention_weights[i, j] > 0.1:  # Threshold
-                    line = Line(
-                        self.tokens[i].get_bottom(),
-                        self.tokens[j].get_bottom(),
-                        path_arc=-0.5,
-                    )
-                    line.set_stroke(
-                        color=YELLOW,
-                        width=attention_weights[i, j] * 5,
-                        opacity=attention_weights[i, j]
-                    )
-                    self.attention_lines.add(line)
+        self.attention_lines = ConnectionLayer(
+            np.zeros((0, 3)),
+            np.zeros((0, 3)),
+            colormap=Colormap([YELLOW]),
+            max_stroke_width=max_stroke_width,
+            path_arc=path_arc,
+        )
+        self.set_attention_weights(attention_weights)
 
         self.add(self.tokens, self.attention_lines)
 
+    def set_attention_weights(self, attention_weights):
+        """Redraw the arcs for a new (n_tokens, n_tokens) weight matrix."""
+        self.attention_weights = np.asarray(attention_weights, dtype=float)
+        rows, cols = select_attention(self.attention_weights, self.top_k, self.threshold)
+        weights = self.attention_weights[rows, cols]
+        anchors = np.array([token.get_bottom() for token in self.tokens])
+        self.attention_lines.set_connections(
+            anchors[rows],
+            anchors[cols],
+            values=weights,
+            widths=weights * self.attention_lines.max_stroke_width,
+            opacities=weights,
+        )
+        return self
+
+
+def line_points(starts, ends):
+    """Bezier points of straight segments, one cubic (and one subpath) per segment."""
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    weights = np.linspace(0, 1, 4)[:, np.newaxis]
+    segments = starts[..., np.newaxis, :] + weights * (ends - starts)[..., np.newaxis, :]
+    return segments.reshape(-1, starts.shape[-1])
+
+
+class Heatmap(Group):
+    """
+    A matrix of colored cells drawn as one image.
+
+    Colors come from ``colormap`` applied to the whole value array, one pixel per
+    cell, and the image is scaled with nearest-neighbor resampling so cells stay
+    sharp. Grid lines, when ``stroke_width`` is set, are a single VMobject.
+    """
+
+    def __init__(
+        self,
+        values,
+        colormap: Optional[Colormap] = None,
+        cell_size: float = 0.5,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+        stroke_color=WHITE,
+        stroke_width: float = 0,
+        stroke_opacity: float = 1.0,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+
+        self.values = np.array(values, dtype=float)
+        self.n_rows, self.n_cols = self.values.shape
+        if colormap is None:
+            colormap = Colormap.sequential((BLACK, YELLOW), 0, 1)
+        self.colormap = colormap
+
+        self.image = ImageMobject(self.get_pixels(self.values))
+        self.image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        self.image.stretch_to_fit_width(self.n_cols * cell_size if width is None else width)
+        self.image.stretch_to_fit_height(self.n_rows * cell_size if height is None else height)
+        self.add(self.image)
+
+        self.grid_lines = VMobject(
+            stroke_color=stroke_color, stroke_width=stroke_width, stroke_opacity=stroke_opacity
+        )
+        if stroke_width > 0:
+            self.grid_lines.set_points(self.get_grid_points())
+            self.add(self.grid_lines)
+
+    def get_pixels(self, values):
+        return np.round(self.colormap(values) * 255).astype(np.uint8)
+
+    def set_values(self, values):
+        """Recolor every cell from a new array of the same shape."""
+        self.values = np.array(values, dtype=float)
+        self.image.pixel_array = self.get_pixels(self.values)
+        self.image.orig_alpha_pixel_array = self.image.pixel_array[:, :, 3].copy()
+        return self
+
+    def grid_point(self, rows, cols):
+        """
+        Points at fractional grid coordinates, (0, 0) being the top-left corner
+        and (n_rows, n_cols) the bottom-right one. Follows any transform of the image.
+        """
+        ul, ur, dl = self.image.points[:3]
+        rows = np.asarray(rows, dtype=float)[..., np.newaxis]
+        cols = np.asarray(cols, dtype=float)[..., np.newaxis]
+        return ul + (cols / self.n_cols) * (ur - ul) + (rows / self.n_rows) * (dl - ul)
+
+    def get_cell_center(self, row, col):
+        return self.grid_point(row + 0.5, col + 0.5)
+
+    def get_region(self, rows=None, cols=None):
+        """A Polygon over the cells in the ``(start, stop)`` row and column ranges."""
+        r0, r1 = (0, self.n_rows) if rows is None else rows
+        c0, c1 = (0, self.n_cols) if cols is None else cols
+        corners = self.grid_point([r0, r0, r1, r1], [c0, c1, c1, c0])
+        return Polygon(*corners, stroke_width=0)
+
+    def get_row(self, row):
+        return self.get_region(rows=(row, row + 1))
+
+    def get_column(self, col):
+        return self.get_region(cols=(col, col + 1))
+
+    def get_grid_points(self):
+        rows = np.arange(self.n_rows + 1)
+        cols = np.arange(self.n_cols + 1)
+        starts = np.concatenate([
+            self.grid_point(rows, np.zeros_like(rows)),
+            self.grid_point(np.zeros_like(cols), cols),
+        ])
+        ends = np.concatenate([
+            self.grid_point(rows, np.full_like(rows, self.n_cols)),
+            self.grid_point(np.full_like(cols, self.n_rows), cols),
+        ])
+        return line_points(starts, ends)
+
+
+@lru_cache(maxsize=None)
+def unit_circle_points():
+    """Bezier points of a unit circle in the xy-plane, shared by every dot template."""
+    points = Circle(radius=1).points.copy()
+    points.flags.writeable = False
+    return points
+
+
+class HeadStack(VGroup):
+    """
+    A stack of attention heads, each a grid of cells with a dot per weight.
+
+    The cell geometry is built once in the head's own 2D frame. A head only adds
+    an affine frame (read back from its border) and a slice of ``patterns``, so
+    the dots of every head come from one array expression and each head is three
+    VMobjects: border, grid lines and dots.
+    """
+
+    def __init__(
+        self,
+        patterns,
+        height: float = 2.5,
+        spacing: float = 0.5,
+        threshold: float = 0.05,
+        dot_color=GREY_B,
+        dot_opacity: float = 0.8,
+        grid_opacity: float = 0.3,
+        border_color=WHITE,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+
+        self.patterns = np.array(patterns, dtype=float)
+        self.n_heads, self.n_rows = self.patterns.shape[:2]
+        self.threshold = threshold
+        self.cell_size = height / (self.n_rows + 0.25)
+
+        # Template geometry, centered on the head
+        half = self.n_rows * self.cell_size / 2
+        self.half_width = half + self.cell_size / 8
+        ticks = np.linspace(-half, half, self.n_rows + 1)
+        centers = (ticks[:-1] + ticks[1:]) / 2
+        self.cell_centers = np.stack(np.meshgrid(centers, centers[::-1]), axis=-1)
+        lines = np.stack([
+            np.stack([np.full_like(ticks, -half), ticks], axis=-1),
+            np.stack([np.full_like(ticks, half), ticks], axis=-1),
+        ], axis=1)
+        grid = np.concatenate([lines, lines[..., ::-1]])
+        corners = self.half_width * np.array([[-1, 1], [1, 1], [1, -1], [-1, -1], [-1, 1]])
+
+        colors = [dot_color] * self.n_heads if isinstance(dot_color, (str, ManimColor)) else dot_color
+        depths = spacing * (np.arange(self.n_heads) - (self.n_heads - 1) / 2)
+        for depth, color in zip(depths, colors):
+            frame = np.array([RIGHT, UP]), OUT * depth
+            border = VMobject(
+                stroke_color=border_color, stroke_width=2, fill_color=BLACK, fill_opacity=0.9
+            )
+            border.set_points(self.to_frame(line_points(corners[:-1], corners[1:]), *frame))
+            grid_lines = VMobject(
+                stroke_color=WHITE, stroke_width=0.5, stroke_opacity=grid_opacity
+            )
+            grid_lines.set_points(self.to_frame(line_points(grid[:, 0], grid[:, 1]), *frame))
+            dots = VMobject(fill_color=color, fill_opacity=dot_opacity, stroke_width=0)
+            self.add(VGroup(border, grid_lines, dots))
+
+        self.set_patterns(self.patterns)
+
+    @staticmethod
+    def to_frame(points, basis, origin):
+        """Map 2D template points through a head frame (2x3 basis plus origin)."""
+        return np.asarray(points)[..., :2] @ basis + origin
+
+    def get_frame(self, head):
+        """The head's current basis and origin, read from its border corners."""
+        points = head[0].points
+        top_left, top_right, bottom_right = points[0], points[4], points[8]
+        basis = np.array([top_right - top_left, top_right - bottom_right]) / (2 * self.half_width)
+        return basis, (top_left + bottom_right) / 2
+
+    def set_patterns(self, patterns):
+        """Redraw the dots of every head from an (n_heads, n_rows, n_rows) array."""
+        self.patterns = np.array(patterns, dtype=float)
+        radii = 0.4 * self.cell_size * self.patterns
+        # (heads, rows, cols, points, 2): every dot of every head at once
+        dots = (
+            self.cell_centers[..., np.newaxis, :]
+            + radii[..., np.newaxis, np.newaxis] * unit_circle_points()[:, :2]
+        )
+        for head, head_dots, shown in zip(self, dots, self.patterns > self.threshold):
+            head[2].set_points(self.to_frame(head_dots[shown].reshape(-1, 2), *self.get_frame(head)))
+        return self
+
 
 # =============================================================================
 # ANIMATION HELPERS
 # =============================================================================
 
 class RandomizeMatrixEntries(Animation):
-    """Animation that smoothly randomizes matrix entries."""
+    """
+    Animation that smoothly randomizes matrix entries.
+
+    All values are interpolated as one array per frame, and an entry is only
+    re-typeset (and recolored) when its rounded, displayed value changes.
+    GlyphNumber entries then reuse the atlas layout cached for each string.
+    """
 
-    def __init__(self, matrix, **kwargs):
+    def __init__(self, matrix, target_values=None, seed=None, **kwargs):
         self.matrix = matrix
-        self.entries = matrix.get_entries()
-        self.start_values = [
-            entry.get_value() if hasattr(entry, 'get_value') else 0
-            for entry in self.entries
+        self.entries = [
+            entry for entry in matrix.get_entries()
+            if hasattr(entry, 'set_value')
         ]
-        self.target_values = np.random.uniform(
-            matrix.value_range[0],
-            matrix.value_range[1],
-            len(self.entries)
-        )
+        self.start_values = np.array([entry.get_value() for entry in self.entries], dtype=float)
+        if target_values is None:
+            target_values = get_rng(seed).uniform(
+                matrix.value_range[0],
+                matrix.value_range[1],
+                len(self.entries)
+            )
+        self.target_values = np.asarray(target_values, dtype=float).ravel()
+        self.scales = 10.0 ** np.array([
+            getattr(entry, 'num_decimal_places', 0) for entry in self.entries
+        ])
+        self.shown_keys = self.get_keys(self.start_values)
+
+        # Entries of an array-backed matrix write back into its values
+        self.value_indices = None
+        if len(self.entries) == len(getattr(matrix, 'entry_indices', ())):
+            self.value_indices = tuple(np.array(matrix.entry_indices).T)
         super().__init__(matrix, **kwargs)
 
+    def get_keys(self, values):
+        # Rounded values as integers: equal keys display the same string
+        return np.rint(values * self.scales).astype(np.int64)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        values = interpolate(self.start_values, self.target_values, alpha)
+        if self.value_indices is not None:
+            self.matrix.values[self.value_indices] = values
+
+        keys = self.get_keys(values)
+        changed = np.flatnonzero(keys != self.shown_keys)
+        if len(changed) == 0:
+            return
+        self.shown_keys = keys
+
+        for index in changed:
+            self.entries[index].set_value(values[index])
+        if self.value_indices is not None and hasattr(self.matrix, 'colormap'):
+            set_fill_by_values(
+                [self.entries[index] for index in changed],
+                values[changed],
+                self.matrix.colormap
+            )
+
+    def finish(self) -> None:
+        super().finish()
+        # Entries whose displayed string never changed still report the exact target
+        for entry, value in zip(self.entries, self.target_values):
+            entry.number = value
+
+
+class RevealHeatmap(Animation):
+    """
+    Fade in a Heatmap's cells, each starting at its own delay.
+
+    ``delays`` holds one start time per cell in any units (scaled to the run
+    time). The default sweeps the cells row by row, like a LaggedStart over
+    the grid. The whole reveal writes one alpha channel per frame.
+    """
+
+    def __init__(self, heatmap, delays=None, fade_ratio=0.1, introducer=True, **kwargs):
+        shape = heatmap.values.shape
+        if delays is None:
+            delays = np.arange(heatmap.values.size).reshape(shape)
+        delays = np.broadcast_to(np.asarray(delays, dtype=float), shape)
+        spread = np.ptp(delays)
+        self.fade_ratio = fade_ratio if spread > 0 else 1.0
+        self.starts = (delays - delays.min()) / (spread or 1) * (1 - self.fade_ratio)
+        self.full_alpha = heatmap.image.orig_alpha_pixel_array.astype(float)
+        self.stroke_opacity = heatmap.grid_lines.get_stroke_opacity()
+        super().__init__(heatmap, introducer=introducer, **kwargs)
+
     def interpolate_mobject(self, alpha: float) -> None:
-        for index, entry in enumerate(self.entries):
-            if hasattr(entry, 'set_value'):
-                start = self.start_values[index]
-                target = self.target_values[index]
-                entry.set_value(interpolate(start, target, alpha))
+        alpha = self.rate_func(alpha)
+        progress = np.clip((alpha - self.starts) / self.fade_ratio, 0, 1)
+        self.mobject.image.pixel_array[:, :, 3] = np.round(self.full_alpha * progress)
+        self.mobject.grid_lines.set_stroke(opacity=self.stroke_opacity * alpha)
 
 
-def show_attention_flow(scene, source_mobs, target_mob, weights=None, run_time=2):
+def show_attention_flow(scene, source_mobs, target_mob, weights=None, run_time=2, seed=None):
     """Helper to animate attention flow from multiple sources to a target."""
     if weights is None:
-        weights = np.random.random(len(source_mobs))
+        weights = get_rng(seed).random(len(source_mobs))
         weights = weights / weights.sum()
 
     arrows = VGroup()
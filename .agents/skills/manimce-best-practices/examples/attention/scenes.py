@@ -16,12 +16,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 from helpers import (
     NumericEmbedding, WeightMatrix, ContextAnimation,
-    NeuralNetwork, AttentionPattern, softmax, value_to_color,
-    random_bright_color, show_attention_flow
+    NeuralNetwork, AttentionPattern, softmax, causal_mask, value_to_color,
+    random_bright_color, show_attention_flow, Colormap, positional_encoding,
+    Heatmap, RevealHeatmap, HeadStack, SeededScene, get_rng
 )
 
 
-class AttentionPatterns(Scene):
+class AttentionPatterns(SeededScene, Scene):
     """
     Demonstrates how attention allows words to influence each other.
     Shows adjectives modifying nouns through attention connections.
@@ -135,7 +136,7 @@ class AttentionPatterns(Scene):
         self.wait(2)
 
 
-class QueryKeyValueExplanation(Scene):
+class QueryKeyValueExplanation(SeededScene, Scene):
     """
     Explains the Query, Key, Value mechanism in attention.
     """
@@ -217,7 +218,7 @@ class QueryKeyValueExplanation(Scene):
         self.wait(2)
 
 
-class AttentionMatrixVisualization(Scene):
+class AttentionMatrixVisualization(SeededScene, Scene):
     """
     Shows how attention scores form a matrix pattern.
     """
@@ -239,24 +240,14 @@ class AttentionMatrixVisualization(Scene):
         key_labels.shift(UP * 2)
 
         # Create attention grid
-        attention_scores = softmax(np.random.randn(n, n) * 2, temperature=0.3)
-
-        grid = VGroup()
-        for i in range(n):
-            row = VGroup()
-            for j in range(n):
-                score = attention_scores[i, j]
-                cell = Square(side_length=0.5)
-                cell.set_fill(
-                    color=interpolate_color(BLACK, YELLOW, score),
-                    opacity=0.8
-                )
-                cell.set_stroke(WHITE, 0.5)
-                row.add(cell)
-            row.arrange(RIGHT, buff=0)
-            grid.add(row)
+        attention_scores = softmax(get_rng().standard_normal((n, n)) * 2, temperature=0.3)
 
-        grid.arrange(DOWN, buff=0)
+        grid = Heatmap(
+            attention_scores,
+            Colormap.sequential((BLACK, YELLOW), 0, 1, opacity=0.8),
+            cell_size=0.5,
+            stroke_width=0.5,
+        )
         grid.next_to(query_labels, RIGHT, buff=0.5)
         grid.align_to(query_labels, UP)
 
@@ -276,15 +267,12 @@ class AttentionMatrixVisualization(Scene):
         self.wait()
 
         # Animate grid appearing
-        all_cells = VGroup(*[cell for row in grid for cell in row])
-        self.play(
-            LaggedStart(*[FadeIn(c, scale=0.5) for c in all_cells], lag_ratio=0.02)
-        )
+        self.play(RevealHeatmap(grid, fade_ratio=0.5))
         self.wait()
 
         # Highlight a row (how "cat" attends to all words)
         highlight_row = 1  # "cat"
-        row_highlight = SurroundingRectangle(grid[highlight_row], color=BLUE, buff=0.05)
+        row_highlight = SurroundingRectangle(grid.get_row(highlight_row), color=BLUE, buff=0.05)
 
         explanation = Text(
             '"cat" attends mostly to itself and "sat"',
@@ -296,7 +284,7 @@ class AttentionMatrixVisualization(Scene):
         self.wait(2)
 
 
-class MultiHeadedAttention(ThreeDScene):
+class MultiHeadedAttention(SeededScene, ThreeDScene):
     """
     Explains multi-head attention mechanism with 3D visualization.
     Shows multiple attention heads arranged in depth with camera rotation.
@@ -329,73 +317,23 @@ class MultiHeadedAttention(ThreeDScene):
         )
         self.wait()
 
-        # Create attention pattern visualization (grid with dots)
-        def create_attention_pattern(n_rows=8, seed=None):
-            """Create a grid visualization of attention weights."""
-            if seed is not None:
-                np.random.seed(seed)
-
-            # Create the base grid
-            grid = VGroup()
-            cell_size = 0.4
-            for i in range(n_rows):
-                for j in range(n_rows):
-                    cell = Square(side_length=cell_size)
-                    cell.set_stroke(WHITE, 0.5, opacity=0.3)
-                    cell.move_to(np.array([j * cell_size, -i * cell_size, 0]))
-                    grid.add(cell)
-
-            grid.center()
-
-            # Generate causal attention pattern (lower triangular)
-            pattern = np.random.normal(0, 1, (n_rows, n_rows))
-            for n in range(n_rows):
-                pattern[:, n][n + 1:] = -np.inf  # Mask future tokens
-                exp_vals = np.exp(pattern[:, n] - np.max(pattern[:, n][pattern[:, n] > -np.inf]))
-                pattern[:, n] = exp_vals / np.sum(exp_vals[exp_vals < np.inf])
-            pattern = np.nan_to_num(pattern, nan=0.0, posinf=0.0, neginf=0.0)
-
-            # Add dots based on attention weights
-            dots = VGroup()
-            for i in range(n_rows):
-                for j in range(n_rows):
-                    value = pattern[i, j]
-                    if value > 0.05:  # Threshold for visibility
-                        dot = Dot(
-                            radius=cell_size * 0.4 * value,
-                            color=GREY_B,
-                            fill_opacity=0.8
-                        )
-                        dot.move_to(grid[i * n_rows + j].get_center())
-                        dots.add(dot)
-
-            # Create border rectangle
-            border = SurroundingRectangle(grid, buff=0.05)
-            border.set_stroke(WHITE, 2)
-            border.set_fill(BLACK, 0.9)
-
-            pattern_mob = VGroup(border, grid, dots)
-            return pattern_mob
-
-        # Create multiple attention heads
-        n_heads = 12
-        heads = VGroup()
-        for i in range(n_heads):
-            head = create_attention_pattern(n_rows=6, seed=i * 42)
-            head.set_height(2.5)
-            heads.add(head)
-
-        # Arrange in 3D depth (along z-axis)
-        for i, head in enumerate(heads):
-            head.shift(OUT * i * 0.5)  # Stack in z direction
-
-        heads.center()
+        # Causal patterns for every head in one call: keys are rows, each query
+        # column is normalized over the keys it can see
+        n_heads = 96
+        n_rows = 6
+        patterns = softmax(
+            get_rng().normal(0, 1, (n_heads, n_rows, n_rows)),
+            axis=1,
+            mask=causal_mask(n_rows).T
+        )
+
+        # Every head shares one cell geometry; stack them in depth (along z-axis)
+        heads = HeadStack(patterns, height=2.5, spacing=6 / (n_heads - 1))
         heads.shift(DOWN * 0.5)
 
         # Show first head (screen rectangle style)
         first_head = heads[-1].copy()
-        first_head.move_to(ORIGIN + DOWN * 0.5)
-        first_head.shift(IN * (n_heads - 1) * 0.25)  # Reset z position
+        first_head.move_to(heads[0])
 
         self.play(FadeIn(first_head))
         self.wait()
@@ -414,7 +352,7 @@ class MultiHeadedAttention(ThreeDScene):
         self.play(
             LaggedStart(
                 *[FadeIn(head, shift=OUT * 0.3) for head in heads[:-1]],
-                lag_ratio=0.15
+                lag_ratio=0.02
             ),
             FadeOut(first_head),
             run_time=3
@@ -429,8 +367,10 @@ class MultiHeadedAttention(ThreeDScene):
         colors = [YELLOW, TEAL]
         n_shown = min(5, n_heads)
 
-        for i, head in enumerate(list(heads)[-n_shown:]):
-            head_num = n_heads - n_shown + i + 1
+        # Label heads spread through the stack so the labels don't overlap
+        for index in np.linspace(0, n_heads - 1, n_shown).astype(int):
+            head = heads[index]
+            head_num = index + 1
             wq = MathTex(f"W_Q^{{({head_num})}}", font_size=28, color=YELLOW)
             wk = MathTex(f"W_K^{{({head_num})}}", font_size=28, color=TEAL)
 
@@ -465,8 +405,8 @@ class MultiHeadedAttention(ThreeDScene):
         )
         self.wait()
 
-        # Add brace showing "96 heads" (scaled down for demonstration)
-        brace_text = Text("96 heads", font_size=36, color=WHITE)
+        # Add brace showing the number of heads
+        brace_text = Text(f"{n_heads} heads", font_size=36, color=WHITE)
         brace_text.rotate(70 * DEGREES, axis=RIGHT)
         brace_text.rotate(-60 * DEGREES, axis=OUT)
         brace_text.next_to(heads, UP, buff=0.8)
@@ -519,7 +459,7 @@ class MultiHeadedAttention(ThreeDScene):
         self.wait(2)
 
 
-class SelfAttentionDemo(Scene):
+class SelfAttentionDemo(SeededScene, Scene):
     """
     Interactive demonstration of self-attention on a simple sentence.
     """
@@ -605,7 +545,7 @@ class SelfAttentionDemo(Scene):
         self.wait(2)
 
 
-class ScaledDotProductAttention(Scene):
+class ScaledDotProductAttention(SeededScene, Scene):
     """
     Step-by-step visualization of scaled dot-product attention.
     """
@@ -694,11 +634,16 @@ class ScaledDotProductAttention(Scene):
         self.wait(2)
 
 
-class PositionalEncoding(Scene):
+class PositionalEncoding(SeededScene, Scene):
     """
     Explains positional encoding in transformers.
+    The full (n_positions x d_model) table is one heatmap, with a zoom into its corner.
     """
 
+    n_positions = 512
+    d_model = 128
+    zoom_size = 16
+
     def construct(self):
         title = Text("Positional Encoding", font_size=42)
         title.to_edge(UP)
@@ -748,38 +693,54 @@ class PositionalEncoding(Scene):
         self.play(Write(formula))
         self.wait()
 
-        # Visual representation
-        positions = VGroup()
-        for i in range(5):
-            pos_vec = VGroup()
-            for j in range(8):
-                val = np.sin(i / (10000 ** (j / 8))) if j % 2 == 0 else np.cos(i / (10000 ** (j / 8)))
-                cell = Square(side_length=0.3)
-                cell.set_fill(interpolate_color(BLUE, RED, (val + 1) / 2), opacity=0.8)
-                cell.set_stroke(WHITE, 0.5)
-                pos_vec.add(cell)
-            pos_vec.arrange(DOWN, buff=0)
-            positions.add(pos_vec)
-
-        positions.arrange(RIGHT, buff=0.2)
-        positions.set_height(2)
-        positions.next_to(formula, DOWN, buff=0.5)
-
-        pos_labels = VGroup(*[
-            Text(f"pos={i}", font_size=16).next_to(p, DOWN, buff=0.1)
-            for i, p in enumerate(positions)
-        ])
+        # Visual representation: positions run left to right, dimensions down
+        table = positional_encoding(self.n_positions, self.d_model).T
+        colormap = Colormap.sequential((BLUE, RED), -1, 1, opacity=0.8)
+        encodings = Heatmap(table, colormap, width=12, height=2)
+        encodings.next_to(formula, DOWN, buff=0.5)
 
+        position_label = Text(f"position (0 to {self.n_positions - 1})", font_size=16)
+        position_label.next_to(encodings, DOWN, buff=0.1)
+        dimension_label = Text(f"dimension ({self.d_model})", font_size=16)
+        dimension_label.rotate(PI / 2).next_to(encodings, LEFT, buff=0.1)
+
+        # Sweep the positions in from left to right
         self.play(
-            LaggedStart(*[FadeIn(p) for p in positions], lag_ratio=0.1),
-            LaggedStart(*[FadeIn(l) for l in pos_labels], lag_ratio=0.1),
+            RevealHeatmap(encodings, delays=np.arange(self.n_positions)[np.newaxis]),
+            FadeIn(position_label),
+            FadeIn(dimension_label),
+            run_time=2
         )
+        self.wait()
+
+        # Zoom into the first positions and dimensions
+        n = self.zoom_size
+        region = encodings.get_region(rows=(0, n), cols=(0, n))
+        box = SurroundingRectangle(region, color=YELLOW, buff=0)
+        self.play(Create(box))
+        self.play(FadeOut(solution), FadeOut(formula))
+
+        zoomed = Heatmap(table[:n, :n], colormap, stroke_width=0.5)
+        zoomed.set_height(2.6)
+        zoomed.move_to(UP * 1.2)
+        zoomed.save_state()
+        zoomed.replace(region, stretch=True)
+        links = VGroup(
+            Line(box.get_corner(UL), zoomed.saved_state.get_corner(DL)),
+            Line(box.get_corner(UR), zoomed.saved_state.get_corner(DR)),
+        ).set_stroke(YELLOW, 1, opacity=0.5)
+
+        zoom_label = Text(f"pos 0-{n - 1}, dims 0-{n - 1}", font_size=16)
+        zoom_label.next_to(zoomed.saved_state, RIGHT, buff=0.2)
+
+        self.play(Restore(zoomed), Create(links), run_time=1.5)
+        self.play(FadeIn(zoom_label))
         self.wait(2)
 
 
 # Additional simplified scenes for the key concepts
 
-class WhatIsAttention(Scene):
+class WhatIsAttention(SeededScene, Scene):
     """Simple introduction to attention."""
 
     def construct(self):
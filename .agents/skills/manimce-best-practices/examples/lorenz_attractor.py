@@ -8,28 +8,148 @@ Run with: manim -pql lorenz_attractor.py LorenzAttractor
 """
 
 from manim import *
-from scipy.integrate import solve_ivp
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+from pathlib import Path
+
 import numpy as np
 
 
 def lorenz_system(t, state, sigma=10, rho=28, beta=8 / 3):
-    """The Lorenz system of differential equations."""
-    x, y, z = state
+    """The Lorenz system of differential equations, for one (3,) or many (..., 3) states."""
+    state = np.asarray(state, dtype=float)
+    x, y, z = state[..., 0], state[..., 1], state[..., 2]
     dxdt = sigma * (y - x)
     dydt = x * (rho - z) - y
     dzdt = x * y - beta * z
-    return [dxdt, dydt, dzdt]
+    return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def rk4_solve(function, state0, time, dt=0.01):
+    """
+    Fixed-step RK4 sampled at np.arange(0, time, dt).
+
+    ``state0`` may stack many initial states, e.g. (N, 3); they are all advanced
+    together, one array operation per stage. Returns (n_steps, *state0.shape).
+    """
+    times = np.arange(0, time, dt)
+    state = np.array(state0, dtype=float)
+    states = np.empty((len(times), *state.shape))
+    for i, t in enumerate(times):
+        states[i] = state
+        k1 = function(t, state)
+        k2 = function(t + dt / 2, state + dt / 2 * k1)
+        k3 = function(t + dt / 2, state + dt / 2 * k2)
+        k4 = function(t + dt, state + dt * k3)
+        state = state + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return states
+
+
+def code_digest(function):
+    """Hash of a function's bytecode and constants, so edits invalidate cached solutions."""
+    code = function.__code__
+    return hashlib.sha256(code.co_code + repr(code.co_consts).encode()).hexdigest()
+
+
+def function_key(function):
+    """Identity of an ODE right-hand side: its name, code and parameter values."""
+    keywords = {}
+    while isinstance(function, functools.partial):
+        keywords = {**function.keywords, **keywords}
+        function = function.func
+    params = {
+        name: parameter.default
+        for name, parameter in inspect.signature(function).parameters.items()
+        if parameter.default is not parameter.empty
+    }
+    params.update(keywords)
+    return [
+        f"{function.__module__}.{function.__qualname__}",
+        code_digest(function),
+        repr(sorted(params.items())),
+    ]
+
+
+def ode_solution_points(function, state0, time, dt=0.01, cache_dir=None, **params):
+    """
+    Solve ODE and return solution points, shaped (..., n_steps, 3) for state0 of shape (..., 3).
+
+    ``params`` (e.g. sigma, rho, beta) are passed to ``function``. Solutions are
+    saved as .npy files in ``cache_dir`` (default ``<media_dir>/ode_cache``, False
+    to disable), keyed on the function, its parameters, the initial states, the
+    time span and dt, and returned memory-mapped, so re-renders skip integration.
+    """
+    if params:
+        function = functools.partial(function, **params)
+    state0 = np.asarray(state0, dtype=float)
+    if cache_dir is False:
+        return np.moveaxis(rk4_solve(function, state0, time, dt), 0, -2)
+
+    cache_dir = Path(config.media_dir) / "ode_cache" if cache_dir is None else Path(cache_dir)
+    h = hashlib.sha256()
+    for part in [*function_key(function), code_digest(rk4_solve), repr((time, dt, state0.shape))]:
+        h.update(part.encode())
+        h.update(b"\0")
+    h.update(state0.tobytes())
+    path = cache_dir / f"{h.hexdigest()[:16]}.npy"
+
+    if not path.exists():
+        points = np.moveaxis(rk4_solve(function, state0, time, dt), 0, -2)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so a parallel render never reads a partial one
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".npy", delete=False) as f:
+            np.save(f, np.ascontiguousarray(points))
+        os.replace(f.name, path)
+    return np.load(path, mmap_mode="r")
+
+
+def coords_to_points(axes, coords):
+    """``axes.c2p`` for a whole array of coordinates, as one affine transform."""
+    origin = np.array(axes.c2p(0, 0, 0))
+    basis = np.array([axes.c2p(*unit) for unit in np.eye(3)]) - origin
+    return np.asarray(coords) @ basis + origin
+
+
+def smooth_curve_points(points):
+    """
+    Cubic bezier points through (..., n, 3) samples, with Catmull-Rom handles.
 
+    Every curve of a stack is built in the same array expression; the result is
+    (..., 4 * (n - 1), 3), ready for ``VMobject.set_points``.
+    """
+    points = np.asarray(points, dtype=float)
+    padded = np.concatenate([points[..., :1, :], points, points[..., -1:, :]], axis=-2)
+    tangents = (padded[..., 2:, :] - padded[..., :-2, :]) / 6
+    starts, ends = points[..., :-1, :], points[..., 1:, :]
+    curves = np.stack([starts, starts + tangents[..., :-1, :], ends - tangents[..., 1:, :], ends], axis=-2)
+    return curves.reshape(*points.shape[:-2], -1, 3)
+
+
+class TraceTrajectories(Animation):
+    """
+    Draw every curve up to the same time, with its dot at the tip.
+
+    Each curve shows a prefix of the bezier points kept in ``starting_mobject``, so
+    a frame is one slice per curve, and the tips are read from the sample array at
+    a single index.
+    """
+
+    def __init__(self, curves, dots, samples, **kwargs):
+        self.samples = np.asarray(samples)
+        kwargs.setdefault("rate_func", linear)
+        # The dots move too, so they belong to the animated mobject
+        super().__init__(VGroup(curves, dots), **kwargs)
 
-def ode_solution_points(function, state0, time, dt=0.01):
-    """Solve ODE and return solution points."""
-    solution = solve_ivp(
-        function,
-        t_span=(0, time),
-        y0=state0,
-        t_eval=np.arange(0, time, dt)
-    )
-    return solution.y.T
+    def interpolate_mobject(self, alpha: float) -> None:
+        index = int(round(self.rate_func(alpha) * (self.samples.shape[1] - 1)))
+        curves, dots = self.mobject
+        for curve, full in zip(curves, self.starting_mobject[0]):
+            curve.set_points(full.points[:4 * index])
+        for dot, tip in zip(dots, self.samples[:, index]):
+            dot.move_to(tip)
 
 
 class LorenzAttractor(ThreeDScene):
@@ -71,44 +191,38 @@ class LorenzAttractor(ThreeDScene):
         # Compute a set of solutions with slightly different initial conditions
         epsilon = 1e-5
         evolution_time = 20  # Reduced for faster rendering
-        n_points = 5  # Reduced for performance
+        n_points = 500
 
-        states = [
-            [10, 10, 10 + n * epsilon]
-            for n in range(n_points)
-        ]
-        colors = color_gradient([BLUE_E, BLUE_A], len(states))
+        states = np.array([10, 10, 10]) + np.outer(np.arange(n_points) * epsilon, OUT)
+        colors = color_gradient([BLUE_E, BLUE_A], n_points)
+
+        # Integrate all trajectories as one (n_points, 3) state and scale them to the axes
+        samples = coords_to_points(
+            axes, ode_solution_points(lorenz_system, states, evolution_time)
+        )
 
         # Create curves from ODE solutions
         curves = VGroup()
-        for state, color in zip(states, colors):
-            points = ode_solution_points(lorenz_system, state, evolution_time)
-            # Scale points to fit axes
-            scaled_points = [axes.c2p(p[0], p[1], p[2]) for p in points]
+        for points, color in zip(smooth_curve_points(samples), colors):
             curve = VMobject()
-            curve.set_points_smoothly(scaled_points)
+            curve.set_points(points)
             curve.set_stroke(color, width=2, opacity=0.8)
             curves.add(curve)
 
-        # Create dots that will trace the curves
+        # Create dots that will trace the curves, always facing the camera
         dots = VGroup(*[
-            Dot3D(color=color, radius=0.15)
-            for color in colors
+            Dot(point, color=color, radius=0.06)
+            for point, color in zip(samples[:, 0], colors)
         ])
 
-        # Position dots at start of curves
-        for dot, curve in zip(dots, curves):
-            dot.move_to(curve.get_start())
-
-        self.add(dots)
+        self.add_fixed_orientation_mobjects(*dots)
 
         # Start ambient camera rotation
         self.begin_ambient_camera_rotation(rate=0.1)
 
         # Animate curves being drawn with dots following
         self.play(
-            *[Create(curve, rate_func=linear) for curve in curves],
-            *[MoveAlongPath(dot, curve, rate_func=linear) for dot, curve in zip(dots, curves)],
+            TraceTrajectories(curves, dots, samples),
             run_time=evolution_time,
         )
 
@@ -138,11 +252,11 @@ class LorenzAttractorSimple(ThreeDScene):
         # Compute single trajectory
         evolution_time = 15
         points = ode_solution_points(lorenz_system, [10, 10, 10], evolution_time)
-        scaled_points = [axes.c2p(p[0], p[1], p[2]) for p in points]
+        scaled_points = coords_to_points(axes, points)
 
         # Create curve
         curve = VMobject()
-        curve.set_points_smoothly(scaled_points)
+        curve.set_points(smooth_curve_points(scaled_points))
         curve.set_stroke(BLUE, width=2)
 
         # Create moving dot with traced path
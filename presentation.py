@@ -1,5 +1,15 @@
 from manim import *
-from manim_slides import Slide
+
+from slidekit import (
+    IncrementalSlide,
+    RenderProfiler,
+    SharedRenderCache,
+    SlideNumberOverlay,
+    SortingBars,
+    bubble_sort_trace,
+    cached_text,
+    slide,
+)
 
 # Apple HIG Dark Mode カラーパレット
 ACCENT = "#0A84FF"          # systemBlue (Dark)
@@ -15,19 +25,18 @@ FONT_MAIN = "Hiragino Kaku Gothic Pro"
 FONT_CODE = "UDEV Gothic 35NFLG"
 
 
-class ClaudeCodeManimSlides(Slide):
+class ClaudeCodeManimSlides(RenderProfiler, SlideNumberOverlay, SharedRenderCache, IncrementalSlide):
 
-    def update_slide_number(self):
-        self.slide_count += 1
-        old_num = self.canvas["slide_number"]
-        new_num = (
-            Text(str(self.slide_count), font_size=18, color=TEXT_TERTIARY, font=FONT_MAIN)
-            .to_corner(DR)
-        )
-        self.play(Transform(old_num, new_num), run_time=0.3)
+    def make_slide_number(self, number):
+        return cached_text(str(number), font_size=18, color=TEXT_TERTIARY, font=FONT_MAIN).to_corner(DR)
+
+    def fast_forward_slide(self, index, method):
+        # 並列レンダリング用: スライド番号はフレームの書き出し時に合成するので、
+        # 前のスライドの状態を復元する必要はない
+        pass
 
     def make_step_label(self, number):
-        return Text(
+        return cached_text(
             f"STEP {number}",
             font_size=18,
             color=TEXT_LABEL,
@@ -39,69 +48,68 @@ class ClaudeCodeManimSlides(Slide):
         for m in list(self.mobjects_without_canvas):
             self.remove(m)
         self.add(new_content)
+        # manim-slides はアニメーションのないスライドを作れないため、まだアニメーションが
+        # なければ静止フレームを出力する（あれば next_slide() が待ち時間を入れる）
+        if self._current_animation == self._start_animation:
+            self.wait(self.wait_time_between_slides)
 
     def construct(self):
         self.camera.background_color = ManimColor(BG_COLOR)
         self.wait_time_between_slides = 0.1
 
-        # Canvas
-        self.slide_count = 1
-        slide_number = Text("1", font_size=18, color=TEXT_TERTIARY, font=FONT_MAIN).to_corner(DR)
-        self.add_to_canvas(slide_number=slide_number)
-        self.add(slide_number)
+        self.play_slides()
 
-        # ---- SLIDE 1: Title ----
-        self.next_slide(notes="今日は、エンジニアの発表資料作りを劇的に楽にする方法についてお話しします。")
+        # 最終スライド — クロージングで終了。空白スライドを生成しない
+        self.next_slide()
 
-        title = Text(
+    # ---- SLIDE 1: Title ----
+    @slide(notes="今日は、エンジニアの発表資料作りを劇的に楽にする方法についてお話しします。")
+    def slide_title(self):
+        title = cached_text(
             "Claude Code + manim-slides\nで発表資料を自動生成する",
             font_size=48, color=TEXT_PRIMARY, weight=BOLD, line_spacing=1.4, font=FONT_MAIN,
         )
-        speaker_info = Text(
+        speaker_info = cached_text(
             "Kazuki Urushiyama / Reckit Team", font_size=18, color=TEXT_TERTIARY, font=FONT_CODE,
         ).to_corner(DR, buff=0.8)
         self.play(FadeIn(title), FadeIn(speaker_info))
 
-        # ---- SLIDE 2: Conclusion ----
-        self.next_slide(notes="結論から言います。Claude Code に自然言語で指示するだけで、アニメーション付きのスライドが完成します。")
-
-        self.update_slide_number()
+    # ---- SLIDE 2: Conclusion ----
+    @slide(notes="結論から言います。Claude Code に自然言語で指示するだけで、アニメーション付きのスライドが完成します。")
+    def slide_conclusion(self):
         # P1: 白文字ベース + キーワードのみ青で強調
-        conc_l1a = Text("Claude Code", font_size=44, color=ACCENT, weight=BOLD, font=FONT_MAIN)
-        conc_l1b = Text(" に指示するだけで", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        conc_l1a = cached_text("Claude Code", font_size=44, color=ACCENT, weight=BOLD, font=FONT_MAIN)
+        conc_l1b = cached_text(" に指示するだけで", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
         conc_line1 = VGroup(conc_l1a, conc_l1b).arrange(RIGHT, buff=0.05)
-        conc_line2 = Text(
+        conc_line2 = cached_text(
             "アニメーション付きスライドが手に入る",
             font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN,
         )
         conclusion = VGroup(conc_line1, conc_line2).arrange(DOWN, buff=0.5)
         self.switch_slide(conclusion)
 
-        # ---- SLIDE 3: Shared Ground ----
-        self.next_slide(notes="皆さん、発表って大事ですよね。でも正直、スライド作りは面倒じゃないですか？")
-
-        self.update_slide_number()
-        empathy = Text(
+    # ---- SLIDE 3: Shared Ground ----
+    @slide(notes="皆さん、発表って大事ですよね。でも正直、スライド作りは面倒じゃないですか？")
+    def slide_shared_ground(self):
+        empathy = cached_text(
             "エンジニアにとって\n発表資料作りは面倒",
             font_size=48, color=TEXT_PRIMARY, weight=BOLD, line_spacing=1.4, font=FONT_MAIN,
         )
         self.switch_slide(empathy)
 
-        # ---- SLIDE 4: Existing Tool Limitations ----
-        self.next_slide(notes="PowerPoint は図形の位置調整に時間を取られます。reveal.js や Beamer はアニメーションが限定的です。")
-
-        self.update_slide_number()
-
-        section_label = Text(
+    # ---- SLIDE 4: Existing Tool Limitations ----
+    @slide(notes="PowerPoint は図形の位置調整に時間を取られます。reveal.js や Beamer はアニメーションが限定的です。")
+    def slide_tool_limitations(self):
+        section_label = cached_text(
             "既存ツールの限界", font_size=20, color=TEXT_LABEL, weight=BOLD, font=FONT_MAIN,
         ).to_edge(UP, buff=0.8)
 
-        tool1_name = Text("PowerPoint / Keynote", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
-        tool1_issue = Text("図形の位置調整に時間を取られる", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+        tool1_name = cached_text("PowerPoint / Keynote", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+        tool1_issue = cached_text("図形の位置調整に時間を取られる", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
         row1 = VGroup(tool1_name, tool1_issue).arrange(RIGHT, buff=0.6)
 
-        tool2_name = Text("reveal.js / Beamer", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
-        tool2_issue = Text("コードで書けるが、アニメーションが限定的", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+        tool2_name = cached_text("reveal.js / Beamer", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+        tool2_issue = cached_text("コードで書けるが、アニメーションが限定的", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
         row2 = VGroup(tool2_name, tool2_issue).arrange(RIGHT, buff=0.6)
 
         rows = VGroup(row1, row2).arrange(DOWN, buff=0.8, aligned_edge=LEFT)
@@ -109,118 +117,76 @@ class ClaudeCodeManimSlides(Slide):
 
         self.switch_slide(slide4)
 
-        # ---- SLIDE 5: What is manim-slides? ----
-        self.next_slide(notes="そこで manim-slides です。Manim をベースに、アニメーション付きスライドを Python コードだけで作れるツールです。HTML にエクスポートできるので、Playwright MCP でブラウザを自動操作してスライドを AI にレビューさせることもできます。これが manim-slides を選ぶ大きな理由の一つです。")
-
-        self.update_slide_number()
-        manim_title = Text("manim-slides", font_size=52, color=ACCENT, weight=BOLD, font=FONT_MAIN)
-        desc1 = Text("Python コードで書くアニメーション付きスライド", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
-        desc2 = Text("Manim の描画力 × プレゼンの操作性", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
-        desc3 = Text("HTML エクスポート → Playwright MCP で AI レビュー", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+    # ---- SLIDE 5: What is manim-slides? ----
+    @slide(notes="そこで manim-slides です。Manim をベースに、アニメーション付きスライドを Python コードだけで作れるツールです。HTML にエクスポートできるので、Playwright MCP でブラウザを自動操作してスライドを AI にレビューさせることもできます。これが manim-slides を選ぶ大きな理由の一つです。")
+    def slide_manim_slides(self):
+        manim_title = cached_text("manim-slides", font_size=52, color=ACCENT, weight=BOLD, font=FONT_MAIN)
+        desc1 = cached_text("Python コードで書くアニメーション付きスライド", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+        desc2 = cached_text("Manim の描画力 × プレゼンの操作性", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
+        desc3 = cached_text("HTML エクスポート → Playwright MCP で AI レビュー", font_size=26, color=TEXT_PRIMARY, font=FONT_MAIN)
         slide5 = VGroup(manim_title, desc1, desc2, desc3).arrange(DOWN, buff=0.6)
         self.switch_slide(slide5)
 
-        # ---- SLIDE 6: Animation Power — Sorting Example ----
-        self.next_slide(notes="例えばソートアルゴリズム。静止画では処理の流れが伝わりにくいですが、アニメーションなら比較・交換の過程を直感的に理解できます。こういった可視化が数行の Python で作れるのが manim-slides の強みです。")
-
-        self.update_slide_number()
-
-        sort_section = Text(
+    # ---- SLIDE 6: Animation Power — Sorting Example ----
+    @slide(notes="例えばソートアルゴリズム。静止画では処理の流れが伝わりにくいですが、アニメーションなら比較・交換の過程を直感的に理解できます。こういった可視化が数行の Python で作れるのが manim-slides の強みです。")
+    def slide_sorting(self):
+        sort_section = cached_text(
             "アニメーションの威力", font_size=20, color=TEXT_LABEL, weight=BOLD, font=FONT_MAIN,
         ).move_to(UP * 3.0)
 
-        sort_title = Text(
+        sort_title = cached_text(
             "例: ソートの可視化", font_size=40, color=ACCENT, weight=BOLD, font=FONT_MAIN,
         ).move_to(UP * 2.0)
 
         # バーチャート: ソート前の配列 [5, 2, 8, 1, 4]
         values = [5, 2, 8, 1, 4]
         baseline_y = DOWN * 1.5
-        bar_spacing = 1.3
-        start_x = -2.6
 
-        bar_items = []
-        bar_group = VGroup()
-        for i, v in enumerate(values):
+        def make_bar(v):
             bar = RoundedRectangle(
                 corner_radius=0.05, width=0.8, height=v * 0.4,
                 color=ACCENT, fill_opacity=0.6, fill_color=ACCENT,
             )
-            lbl = Text(str(v), font_size=20, color=TEXT_PRIMARY, font=FONT_CODE)
+            lbl = cached_text(str(v), font_size=20, color=TEXT_PRIMARY, font=FONT_CODE)
             # バーを下揃えで配置
-            x_pos = start_x + i * bar_spacing
-            bar.move_to(baseline_y, aligned_edge=DOWN).set_x(x_pos)
+            bar.move_to(baseline_y, aligned_edge=DOWN)
             lbl.next_to(bar, DOWN, buff=0.15)
-            item = VGroup(bar, lbl)
-            bar_items.append(item)
-            bar_group.add(item)
+            return VGroup(bar, lbl)
 
-        sort_static = VGroup(sort_section, sort_title, bar_group)
+        def make_compare_label(step):
+            left_val, right_val = step.values
+            if step.moved:
+                return cached_text(f"{left_val} > {right_val} → 交換!", font_size=22, color=ACCENT, font=FONT_MAIN)
+            return cached_text(f"{left_val} ≤ {right_val} → OK", font_size=22, color=TEXT_PRIMARY, font=FONT_MAIN)
+
+        bars = SortingBars(values, make_bar, spacing=1.3, highlight_color=HIG_YELLOW)
+        sort_static = VGroup(sort_section, sort_title, bars)
         self.switch_slide(sort_static)
 
-        # バブルソート全体をアニメーション（各ステップに間隔を入れる）
-        n = len(values)
-        for pass_idx in range(n - 1):
-            for j in range(n - 1 - pass_idx):
-                left_val = int(bar_items[j][1].text)
-                right_val = int(bar_items[j + 1][1].text)
-
-                # ハイライト
-                hl_left = SurroundingRectangle(bar_items[j], color=HIG_YELLOW, buff=0.08, corner_radius=0.1)
-                hl_right = SurroundingRectangle(bar_items[j + 1], color=HIG_YELLOW, buff=0.08, corner_radius=0.1)
-                self.play(Create(hl_left), Create(hl_right), run_time=0.4)
-
-                if left_val > right_val:
-                    cmp_text = Text(
-                        f"{left_val} > {right_val} → 交換!", font_size=22, color=ACCENT, font=FONT_MAIN,
-                    ).move_to(DOWN * 3.2)
-                    self.play(FadeIn(cmp_text), run_time=0.3)
-
-                    # ハイライトを先に消してから交換（枠の突き抜け防止）
-                    self.play(FadeOut(hl_left), FadeOut(hl_right), run_time=0.2)
-
-                    x_left = bar_items[j].get_x()
-                    x_right = bar_items[j + 1].get_x()
-                    self.play(
-                        bar_items[j].animate.set_x(x_right),
-                        bar_items[j + 1].animate.set_x(x_left),
-                        run_time=0.6,
-                    )
-                    bar_items[j], bar_items[j + 1] = bar_items[j + 1], bar_items[j]
-
-                    self.play(FadeOut(cmp_text), run_time=0.3)
-                else:
-                    cmp_text = Text(
-                        f"{left_val} ≤ {right_val} → OK", font_size=22, color=TEXT_PRIMARY, font=FONT_MAIN,
-                    ).move_to(DOWN * 3.2)
-                    self.play(FadeIn(cmp_text), run_time=0.3)
-                    self.play(FadeOut(hl_left), FadeOut(hl_right), FadeOut(cmp_text), run_time=0.3)
-
-                # 各ステップ間に間隔をあける
-                self.wait(0.5)
+        # バブルソート全体を 1 つのアニメーションで再生（各ステップに間隔を入れる）
+        self.play(bars.sort_animation(
+            bubble_sort_trace(values), make_label=make_compare_label, label_position=DOWN * 3.2,
+        ))
 
         # ソート完了の表示
-        done_text = Text("ソート完了!", font_size=28, color=ACCENT, weight=BOLD, font=FONT_MAIN).move_to(DOWN * 3.2)
+        done_text = cached_text("ソート完了!", font_size=28, color=ACCENT, weight=BOLD, font=FONT_MAIN).move_to(DOWN * 3.2)
         self.play(FadeIn(done_text), run_time=0.4)
         self.wait(0.8)
         self.play(FadeOut(done_text), run_time=0.3)
 
-        # ---- SLIDE 7: But Python is tedious? ----
-        self.next_slide(notes="manim-slides は強力ですが、このようなアニメーションも Python コードで書く必要があります。そこで Claude Code の出番です。")
-
-        self.update_slide_number()
-        bridge = Text(
+    # ---- SLIDE 7: But Python is tedious? ----
+    @slide(notes="manim-slides は強力ですが、このようなアニメーションも Python コードで書く必要があります。そこで Claude Code の出番です。")
+    def slide_bridge(self):
+        bridge = cached_text(
             "でも Python を書くのも面倒？",
             font_size=48, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN,
         )
         self.switch_slide(bridge)
 
-        # ---- SLIDE 7: Workflow Overview ----
-        self.next_slide(notes="ワークフローは全部で7ステップです。ブルーの枠がついているのは Claude Code のカスタムスキルが自動でやってくれる部分です。Claude Code にはプロジェクト固有の知識やルールを教えられるカスタムスキルという機能があり、このワークフローでは3つのスキルを使います。slides-composer が構成設計、manim-slides-best-practices がコード生成、slide-reviewer がレビューを担当します。")
-
-        self.update_slide_number()
-
-        wf_section = Text(
+    # ---- SLIDE 7: Workflow Overview ----
+    @slide(notes="ワークフローは全部で7ステップです。ブルーの枠がついているのは Claude Code のカスタムスキルが自動でやってくれる部分です。Claude Code にはプロジェクト固有の知識やルールを教えられるカスタムスキルという機能があり、このワークフローでは3つのスキルを使います。slides-composer が構成設計、manim-slides-best-practices がコード生成、slide-reviewer がレビューを担当します。")
+    def slide_workflow(self):
+        wf_section = cached_text(
             "ワークフロー全体像", font_size=20, color=TEXT_LABEL, weight=BOLD, font=FONT_MAIN,
         ).to_edge(UP, buff=0.8)
 
@@ -249,9 +215,9 @@ class ClaudeCodeManimSlides(Slide):
                 corner_radius=0.1, width=3.0, height=1.0,
                 color=color, fill_opacity=0.08,
             )
-            txt = Text(label, font_size=18, color=TEXT_PRIMARY, font=FONT_MAIN)
+            txt = cached_text(label, font_size=18, color=TEXT_PRIMARY, font=FONT_MAIN)
             if skill:
-                skill_txt = Text(skill, font_size=11, color=TEXT_TERTIARY, font=FONT_CODE)
+                skill_txt = cached_text(skill, font_size=11, color=TEXT_TERTIARY, font=FONT_CODE)
                 content = VGroup(txt, skill_txt).arrange(DOWN, buff=0.12)
                 content.move_to(box)
                 boxes.add(VGroup(box, content))
@@ -286,30 +252,28 @@ class ClaudeCodeManimSlides(Slide):
             corner_radius=0.05, width=0.25, height=0.25,
             color=ACCENT, fill_opacity=0.08,
         )
-        legend_text = Text("= Claude Code カスタムスキル", font_size=14, color=TEXT_PRIMARY, font=FONT_MAIN)
+        legend_text = cached_text("= Claude Code カスタムスキル", font_size=14, color=TEXT_PRIMARY, font=FONT_MAIN)
         legend = VGroup(legend_box, legend_text).arrange(RIGHT, buff=0.2)
         legend.to_edge(DOWN, buff=0.8)
 
         slide7 = VGroup(wf_section, flow, legend).arrange(DOWN, buff=0.6)
         self.switch_slide(slide7)
 
-        # ---- SLIDE: Steps 1-2 Combined — P4: 補足ステップ統合 ----
-        self.next_slide(notes="最初のステップは Claude Code にアイデアを伝えるだけです。すると Claude Code が聴衆、発表時間、目的などを質問してきます。選択肢から選ぶだけで要件が整理されます。")
-
-        self.update_slide_number()
-
-        step12_label = Text(
+    # ---- SLIDE: Steps 1-2 Combined — P4: 補足ステップ統合 ----
+    @slide(notes="最初のステップは Claude Code にアイデアを伝えるだけです。すると Claude Code が聴衆、発表時間、目的などを質問してきます。選択肢から選ぶだけで要件が整理されます。")
+    def slide_steps_1_2(self):
+        step12_label = cached_text(
             "STEP 1-2", font_size=18, color=TEXT_LABEL, weight=BOLD, font=FONT_MAIN,
         ).to_edge(UP, buff=0.8)
-        step12_title = Text("アイデアから要件整理へ", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        step12_title = cached_text("アイデアから要件整理へ", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
 
         # Step 1: プロンプト（コンパクト版）
         prompt_bg = RoundedRectangle(
             corner_radius=0.15, width=9.0, height=0.7,
             color=TEXT_SECONDARY, fill_opacity=0.05, fill_color="#2C2C2E",
         )
-        prompt_mark = Text(">", font_size=20, color=ACCENT, font=FONT_CODE)
-        prompt_text = Text(
+        prompt_mark = cached_text(">", font_size=20, color=ACCENT, font=FONT_CODE)
+        prompt_text = cached_text(
             "manim-slides の紹介 LT を作りたい", font_size=20, color=TEXT_PRIMARY, font=FONT_CODE,
         )
         prompt_content = VGroup(prompt_mark, prompt_text).arrange(RIGHT, buff=0.3)
@@ -317,7 +281,7 @@ class ClaudeCodeManimSlides(Slide):
         prompt = VGroup(prompt_bg, prompt_content)
 
         # 矢印（Step 1 → Step 2 の流れを示す）
-        down_arrow = Text("↓", font_size=28, color=TEXT_LABEL, font=FONT_MAIN)
+        down_arrow = cached_text("↓", font_size=28, color=TEXT_LABEL, font=FONT_MAIN)
 
         # Step 2: 対話の質問（コンパクト版）
         q_mobjects = VGroup()
@@ -326,7 +290,7 @@ class ClaudeCodeManimSlides(Slide):
                 corner_radius=0.12, width=5.5, height=0.55,
                 color=ACCENT, fill_opacity=0.08,
             )
-            q = Text(q_text, font_size=18, color=TEXT_PRIMARY, font=FONT_MAIN)
+            q = cached_text(q_text, font_size=18, color=TEXT_PRIMARY, font=FONT_MAIN)
             q.move_to(bubble)
             q_mobjects.add(VGroup(bubble, q))
         q_mobjects.arrange(DOWN, buff=0.2)
@@ -336,13 +300,11 @@ class ClaudeCodeManimSlides(Slide):
 
         self.switch_slide(slide_step12)
 
-        # ---- SLIDE 10: Step 3 ----
-        self.next_slide(notes="対話が終わると、Claude Code が slides.md というスライド構成書を自動生成します。配色やトランジションまで全て設計されています。")
-
-        self.update_slide_number()
-
+    # ---- SLIDE 10: Step 3 ----
+    @slide(notes="対話が終わると、Claude Code が slides.md というスライド構成書を自動生成します。配色やトランジションまで全て設計されています。")
+    def slide_step_3(self):
         step3_label = self.make_step_label(3)
-        step3_title = Text("構成設計: slides.md", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        step3_title = cached_text("構成設計: slides.md", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
 
         doc_box = RoundedRectangle(
             corner_radius=0.15, width=8.0, height=3.5,
@@ -357,8 +319,8 @@ class ClaudeCodeManimSlides(Slide):
         ]
         line_mobjects = VGroup()
         for key, val, kcolor, vcolor in doc_lines_data:
-            k = Text(key, font_size=22, color=kcolor, weight=BOLD, font=FONT_MAIN)
-            v = Text(val, font_size=22, color=vcolor, font=FONT_MAIN)
+            k = cached_text(key, font_size=22, color=kcolor, weight=BOLD, font=FONT_MAIN)
+            v = cached_text(val, font_size=22, color=vcolor, font=FONT_MAIN)
             line_mobjects.add(VGroup(k, v).arrange(RIGHT, buff=0.3))
         line_mobjects.arrange(DOWN, buff=0.35, aligned_edge=LEFT)
         line_mobjects.move_to(doc_box)
@@ -369,22 +331,20 @@ class ClaudeCodeManimSlides(Slide):
 
         self.switch_slide(slide10)
 
-        # ---- SLIDE 11: Step 4 ----
-        self.next_slide(notes="slides.md を元に、Claude Code が manim-slides の Python コードを自動生成します。ベストプラクティスに沿ったコードが出力されます。")
-
-        self.update_slide_number()
-
+    # ---- SLIDE 11: Step 4 ----
+    @slide(notes="slides.md を元に、Claude Code が manim-slides の Python コードを自動生成します。ベストプラクティスに沿ったコードが出力されます。")
+    def slide_step_4(self):
         step4_label = self.make_step_label(4)
-        step4_title = Text("Python コードを自動生成", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        step4_title = cached_text("Python コードを自動生成", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
 
         code_box = RoundedRectangle(
             corner_radius=0.15, width=9.0, height=3.0,
             color=TEXT_SECONDARY, fill_opacity=0.05,
         )
-        code_line1 = Text("class Presentation(Slide):", font_size=22, color=ACCENT, font=FONT_CODE)
-        code_line2 = Text("def construct(self):", font_size=22, color=TEXT_PRIMARY, font=FONT_CODE)
-        code_line3 = Text("# Canvas, Wipe, Progressive reveal...", font_size=22, color=TEXT_SECONDARY, font=FONT_CODE)
-        code_line4 = Text("# 全て自動で構成", font_size=22, color=TEXT_SECONDARY, font=FONT_CODE)
+        code_line1 = cached_text("class Presentation(Slide):", font_size=22, color=ACCENT, font=FONT_CODE)
+        code_line2 = cached_text("def construct(self):", font_size=22, color=TEXT_PRIMARY, font=FONT_CODE)
+        code_line3 = cached_text("# Canvas, Wipe, Progressive reveal...", font_size=22, color=TEXT_SECONDARY, font=FONT_CODE)
+        code_line4 = cached_text("# 全て自動で構成", font_size=22, color=TEXT_SECONDARY, font=FONT_CODE)
         code_lines = VGroup(code_line1, code_line2, code_line3, code_line4)
         code_lines.arrange(DOWN, buff=0.25, aligned_edge=LEFT)
         # Python のインデントを明示的に再現
@@ -400,15 +360,13 @@ class ClaudeCodeManimSlides(Slide):
 
         self.switch_slide(slide11)
 
-        # ---- SLIDE: Steps 5&7 Combined — P4: 補足ステップ統合 ----
-        self.next_slide(notes="コードが生成されたら、2つのコマンドでレンダリングと HTML エクスポートを行います。完成したスライドは HTML, PPTX, PDF にもエクスポートできます。")
-
-        self.update_slide_number()
-
-        step57_label = Text(
+    # ---- SLIDE: Steps 5&7 Combined — P4: 補足ステップ統合 ----
+    @slide(notes="コードが生成されたら、2つのコマンドでレンダリングと HTML エクスポートを行います。完成したスライドは HTML, PPTX, PDF にもエクスポートできます。")
+    def slide_steps_5_7(self):
+        step57_label = cached_text(
             "STEP 5 & 7", font_size=18, color=TEXT_LABEL, weight=BOLD, font=FONT_MAIN,
         ).to_edge(UP, buff=0.8)
-        step57_title = Text("ビルド & デリバリー", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        step57_title = cached_text("ビルド & デリバリー", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
 
         # ターミナル（コンパクト版）
         term_bg = RoundedRectangle(
@@ -419,12 +377,12 @@ class ClaudeCodeManimSlides(Slide):
         dot_yellow = Dot(radius=0.05, color=HIG_YELLOW).next_to(dot_red, RIGHT, buff=0.12)
         dot_green = Dot(radius=0.05, color=HIG_GREEN).next_to(dot_yellow, RIGHT, buff=0.12)
 
-        dollar1 = Text("$", font_size=16, color=ACCENT, font=FONT_CODE)
-        cmd1_text = Text("manim-slides render presentation.py", font_size=16, color=TEXT_PRIMARY, font=FONT_CODE)
+        dollar1 = cached_text("$", font_size=16, color=ACCENT, font=FONT_CODE)
+        cmd1_text = cached_text("manim-slides render presentation.py", font_size=16, color=TEXT_PRIMARY, font=FONT_CODE)
         cmd1 = VGroup(dollar1, cmd1_text).arrange(RIGHT, buff=0.2)
 
-        dollar2 = Text("$", font_size=16, color=ACCENT, font=FONT_CODE)
-        cmd2_text = Text("manim-slides convert --to html ... output.html", font_size=16, color=TEXT_PRIMARY, font=FONT_CODE)
+        dollar2 = cached_text("$", font_size=16, color=ACCENT, font=FONT_CODE)
+        cmd2_text = cached_text("manim-slides convert --to html ... output.html", font_size=16, color=TEXT_PRIMARY, font=FONT_CODE)
         cmd2 = VGroup(dollar2, cmd2_text).arrange(RIGHT, buff=0.2)
 
         cmds = VGroup(cmd1, cmd2).arrange(DOWN, buff=0.25, aligned_edge=LEFT)
@@ -436,8 +394,8 @@ class ClaudeCodeManimSlides(Slide):
         # エクスポート形式（横並びコンパクト版）
         export_items = VGroup()
         for fmt, desc in [("▶ Live", "発表"), ("HTML", "共有"), ("PPTX", "互換"), ("PDF", "保存")]:
-            f_text = Text(fmt, font_size=18, color=ACCENT, weight=BOLD, font=FONT_CODE)
-            d_text = Text(desc, font_size=16, color=TEXT_PRIMARY, font=FONT_MAIN)
+            f_text = cached_text(fmt, font_size=18, color=ACCENT, weight=BOLD, font=FONT_CODE)
+            d_text = cached_text(desc, font_size=16, color=TEXT_PRIMARY, font=FONT_MAIN)
             export_items.add(VGroup(f_text, d_text).arrange(DOWN, buff=0.15))
         export_items.arrange(RIGHT, buff=0.8)
 
@@ -446,15 +404,13 @@ class ClaudeCodeManimSlides(Slide):
 
         self.switch_slide(slide_step57)
 
-        # ---- SLIDE 13: Step 6 — Review with Playwright MCP ----
-        self.next_slide(notes="HTML にエクスポートしたスライドを Playwright MCP でブラウザに表示し、各スライドのスクリーンショットを自動で撮影します。聴衆目線でメッセージ明確性、認知負荷、可読性などを評価し、改善点を特定してコードに反映します。")
-
-        self.update_slide_number()
-
+    # ---- SLIDE 13: Step 6 — Review with Playwright MCP ----
+    @slide(notes="HTML にエクスポートしたスライドを Playwright MCP でブラウザに表示し、各スライドのスクリーンショットを自動で撮影します。聴衆目線でメッセージ明確性、認知負荷、可読性などを評価し、改善点を特定してコードに反映します。")
+    def slide_step_6(self):
         step6_label = self.make_step_label(6)
-        step6_title = Text("Playwright MCP でレビュー", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        step6_title = cached_text("Playwright MCP でレビュー", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
         # P7: Playwright MCP の補足説明を追加
-        step6_subtitle = Text(
+        step6_subtitle = cached_text(
             "ブラウザ自動操作でスライドを聴衆目線で評価",
             font_size=20, color=TEXT_LABEL, font=FONT_MAIN,
         )
@@ -481,45 +437,40 @@ class ClaudeCodeManimSlides(Slide):
         ]:
             is_issue = check == "!"
             check_color = HIG_YELLOW if is_issue else HIG_GREEN
-            mark = Text(check, font_size=20, color=check_color, font=FONT_MAIN)
-            label = Text(criterion, font_size=20, color=TEXT_PRIMARY if not is_issue else ACCENT, font=FONT_MAIN)
+            mark = cached_text(check, font_size=20, color=check_color, font=FONT_MAIN)
+            label = cached_text(criterion, font_size=20, color=TEXT_PRIMARY if not is_issue else ACCENT, font=FONT_MAIN)
             review_items.add(VGroup(mark, label).arrange(RIGHT, buff=0.3))
         review_items.arrange(DOWN, buff=0.3, aligned_edge=LEFT)
         review_items.move_to(browser_bg).shift(DOWN * 0.2)
 
         browser = VGroup(browser_bg, b_window_bar, review_items)
 
-        review_note = Text("スクリーンショット × 聴衆視点の自動評価", font_size=18, color=TEXT_PRIMARY, font=FONT_MAIN)
+        review_note = cached_text("スクリーンショット × 聴衆視点の自動評価", font_size=18, color=TEXT_PRIMARY, font=FONT_MAIN)
 
         slide13_body = VGroup(step6_title, step6_subtitle, browser, review_note).arrange(DOWN, buff=0.3)
         slide13 = VGroup(step6_label, slide13_body).arrange(DOWN, buff=0.4)
 
         self.switch_slide(slide13)
 
-        # ---- SLIDE: Evidence ----
-        self.next_slide(notes="実はこのプレゼン自体が、Claude Code に指示して manim-slides で生成したものです。もちろん完璧に一発で出るわけではなく、レイアウトの微調整は必要ですが、ゼロから作るのとは比べものになりません。Python の知識がなくても Claude Code が書いてくれるので大丈夫です。")
-
-        self.update_slide_number()
+    # ---- SLIDE: Evidence ----
+    @slide(notes="実はこのプレゼン自体が、Claude Code に指示して manim-slides で生成したものです。もちろん完璧に一発で出るわけではなく、レイアウトの微調整は必要ですが、ゼロから作るのとは比べものになりません。Python の知識がなくても Claude Code が書いてくれるので大丈夫です。")
+    def slide_evidence(self):
         # P1: 白文字ベース + ツール名のみ青で強調
-        meta_l1 = Text("このスライドも", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
-        meta_l2 = Text("Claude Code + manim-slides", font_size=44, color=ACCENT, weight=BOLD, font=FONT_MAIN)
-        meta_l3 = Text("で作りました", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        meta_l1 = cached_text("このスライドも", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
+        meta_l2 = cached_text("Claude Code + manim-slides", font_size=44, color=ACCENT, weight=BOLD, font=FONT_MAIN)
+        meta_l3 = cached_text("で作りました", font_size=44, color=TEXT_PRIMARY, weight=BOLD, font=FONT_MAIN)
         meta = VGroup(meta_l1, meta_l2, meta_l3).arrange(DOWN, buff=0.5)
         self.switch_slide(meta)
 
-        # ---- SLIDE 15: Closing ----
-        self.next_slide(notes="伝えたいことを言語化するだけで、あとは Claude Code と manim-slides が形にしてくれます。ぜひ試してみてください。")
-
-        self.update_slide_number()
-        closing_msg = Text(
+    # ---- SLIDE 15: Closing ----
+    @slide(notes="伝えたいことを言語化するだけで、あとは Claude Code と manim-slides が形にしてくれます。ぜひ試してみてください。")
+    def slide_closing(self):
+        closing_msg = cached_text(
             "伝えたいことを伝えるだけ。\nスライドは Claude Code が作る。",
             font_size=44, color=TEXT_PRIMARY, weight=BOLD, line_spacing=1.4, font=FONT_MAIN,
         )
-        install_cmd = Text(
+        install_cmd = cached_text(
             "pip install manim-slides", font_size=20, color=TEXT_TERTIARY, font=FONT_CODE,
         )
         closing = VGroup(closing_msg, install_cmd).arrange(DOWN, buff=1.0)
         self.switch_slide(closing)
-
-        # 最終スライド — クロージングで終了。空白スライドを生成しない
-        self.next_slide()
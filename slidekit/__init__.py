@@ -0,0 +1,35 @@
+"""presentation.py から使う manim-slides 向けの補助ツール群。"""
+
+from .incremental import IncrementalSlide, slide
+from .overlay import SlideNumberOverlay
+from .profiler import RenderProfiler
+from .render_cache import HTTPRenderCache, LocalRenderCache, RenderCache, SharedRenderCache
+from .sorting import (
+    SortingBars,
+    SortStep,
+    SortTraceAnimation,
+    bubble_sort_trace,
+    insertion_sort_trace,
+    merge_sort_trace,
+)
+from .text_cache import cached_text, clear_text_cache, text_cache_info
+
+__all__ = [
+    "HTTPRenderCache",
+    "IncrementalSlide",
+    "LocalRenderCache",
+    "RenderCache",
+    "RenderProfiler",
+    "SharedRenderCache",
+    "SlideNumberOverlay",
+    "SortStep",
+    "SortTraceAnimation",
+    "SortingBars",
+    "bubble_sort_trace",
+    "cached_text",
+    "clear_text_cache",
+    "insertion_sort_trace",
+    "merge_sort_trace",
+    "slide",
+    "text_cache_info",
+]
@@ -0,0 +1,97 @@
+"""
+スライドのスクリーンショットを動画から直接書き出す。
+
+slide-reviewer は RevealJS の HTML をブラウザで開き、スライドごとに移動・待機・
+撮影を繰り返している。ここではブラウザを使わず、``slides/<Scene>.json`` の各スライド
+動画の最終フレーム（スライドが止まったときに聴衆が見る画面）を PNG に書き出し、
+スピーカーノートと合わせたマニフェストを 1 回で作る。
+
+    uv run python -m slidekit.capture ClaudeCodeManimSlides -o review/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import av
+from manim_slides.config import PresentationConfig, SlideConfig
+from manim_slides.defaults import FOLDER_PATH
+from PIL import Image
+
+
+def read_frame(file: Path, last: bool = True) -> Image.Image:
+    """動画の最初または最後のフレームを返す。最後のフレームは末尾のキーフレームから読む。"""
+    with av.open(str(file)) as container:
+        stream = container.streams.video[0]
+        if not last:
+            return next(container.decode(stream)).to_image()
+
+        frame = None
+        if stream.duration is not None:
+            container.seek(stream.duration, stream=stream, backward=True, any_frame=False)
+            for frame in container.decode(stream):
+                pass
+        if frame is None:
+            # 長さが分からない、またはシークできない動画は先頭から読む
+            container.seek(0)
+            for frame in container.decode(stream):
+                pass
+        return frame.to_image()
+
+
+def capture_slides(
+    presentation: PresentationConfig,
+    output_dir: Path,
+    last: bool = True,
+    jobs: int | None = None,
+) -> list[dict]:
+    """全スライドの画像を ``output_dir`` に書き出し、マニフェストの項目を返す。"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    digits = len(str(len(presentation.slides)))
+
+    def capture(item: tuple[int, SlideConfig]) -> dict:
+        number, slide_config = item
+        image_path = output_dir / f"slide_{number:0{digits}}.png"
+        read_frame(slide_config.file, last=last).save(image_path)
+        return {
+            "number": number,
+            "image": image_path.name,
+            "video": str(slide_config.file),
+            "notes": slide_config.notes,
+            "loop": slide_config.loop,
+            "auto_next": slide_config.auto_next,
+        }
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(capture, enumerate(presentation.slides, start=1)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scene")
+    parser.add_argument("-o", "--output", type=Path, default=Path("screenshots"))
+    parser.add_argument("--folder", type=Path, default=FOLDER_PATH)
+    parser.add_argument("--frame", choices=("last", "first"), default="last")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    presentation = PresentationConfig.from_file(args.folder / f"{args.scene}.json")
+    slides = capture_slides(presentation, args.output, last=args.frame == "last", jobs=args.jobs)
+
+    manifest = {
+        "scene": args.scene,
+        "resolution": list(presentation.resolution),
+        "frame": args.frame,
+        "slides": slides,
+    }
+    manifest_path = args.output / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Captured {len(slides)} slides into '{args.output}' ({manifest_path.name})")
+
+
+if __name__ == "__main__":
+    main()
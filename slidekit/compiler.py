@@ -0,0 +1,577 @@
+"""
+slides.md から presentation.py を生成するコンパイラー。
+
+slides.md の ``## Slide N: タイトル`` セクションを解析し、Type と Content / Visual Elements
+からスライドの種類（タイトル・結論・ステップ・ターミナル・ブラウザなど）を決めて、
+種類ごとのビルダーで ``@slide`` メソッドを生成する。
+
+生成したメソッドの直前には、セクションのハッシュを含むマーカーコメントを置く。
+
+    # ---- Slide 5.5: アニメーションの威力 [slides.md 1a2b3c4d] ----
+
+再コンパイル時はハッシュが変わったスライドだけを生成し直し、それ以外のメソッドは
+手で修正した内容も含めてそのまま残す。Speaker Notes だけが変わったスライドは
+``@slide(notes=...)`` の引数だけを書き換える。マーカーのないコードには触れない。
+
+    uv run python -m slidekit.compiler slides.md -o presentation.py --scene ClaudeCodeManimSlides
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+MARKER_RE = re.compile(r"^\s*# ---- Slide (\S+): .* \[slides\.md ([0-9a-f]{8})\] ----\s*$")
+SLIDE_HEADING_RE = re.compile(r"^## Slide (\S+?):\s*(.+)$", re.MULTILINE)
+ITEM_RE = re.compile(r'"([^"]+)"\s*(?:\(([^)]*)\))?')
+
+# slides.md の Color Palette の Role と presentation.py の定数名
+PALETTE_NAMES = {
+    "Background": "BG_COLOR",
+    "Text Primary": "TEXT_PRIMARY",
+    "Text Secondary": "TEXT_SECONDARY",
+    "Text Tertiary": "TEXT_TERTIARY",
+    "Accent": "ACCENT",
+}
+DEFAULT_PALETTE = {
+    "BG_COLOR": "#111111",
+    "TEXT_PRIMARY": "#FFFFFF",
+    "TEXT_SECONDARY": "#BBBBBB",
+    "TEXT_TERTIARY": "#666666",
+    "ACCENT": "#3B82F6",
+}
+DEFAULT_FONT_SIZES = {"Primary": 44, "Secondary": 24, "Tertiary": 16}
+WINDOW_DOT_COLORS = ("#FF5F57", "#FEBC2E", "#28C840")
+PROGRESSIVE_WORDS = ("Progressive reveal", "段階的", "1つずつ", "順次")
+CHECK_MARKS = ("✓", "✗", "!")
+
+
+@dataclass(frozen=True)
+class ContentItem:
+    """Content の 1 つのテキストと、その後ろの括弧内の役割（``Primary, Accent`` など）。"""
+
+    text: str
+    roles: tuple[str, ...] = ()
+
+    @property
+    def level(self) -> str:
+        for level in ("Primary", "Secondary", "Tertiary"):
+            if level in self.roles:
+                return level
+        return "Secondary"
+
+    @property
+    def accent(self) -> bool:
+        return "Accent" in self.roles
+
+    @property
+    def code(self) -> bool:
+        return any("コード" in role or "コマンド" in role for role in self.roles) or self.text.startswith(
+            ("$", "pip ", "class ")
+        )
+
+
+# Content の 1 行。``"A" → "B"`` のような行は複数の項目を横に並べる
+Row = tuple[ContentItem, ...]
+
+
+@dataclass
+class SlideSpec:
+    number: str
+    title: str
+    type: str = ""
+    sections: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def notes(self) -> str:
+        notes = " ".join(self.sections.get("Speaker Notes", "").split())
+        return notes.removeprefix("「").removesuffix("」")
+
+    @property
+    def method_name(self) -> str:
+        return "slide_" + re.sub(r"\W", "_", self.number)
+
+    @property
+    def content_hash(self) -> str:
+        """生成コードに影響する部分（Speaker Notes 以外）のハッシュ。"""
+        parts = [self.title, self.type] + [
+            f"{name}\n{body}" for name, body in self.sections.items() if name != "Speaker Notes"
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:8]
+
+    def _content_lines(self) -> list[str]:
+        """Content の各行から箇条書きの記号（``-``、``1.``）を取り除いたもの。"""
+        lines = self.sections.get("Content", "").splitlines()
+        return [re.sub(r"^\s*(?:-|\d+\.)?\s*", "", line) for line in lines if line.strip()]
+
+    def rows(self) -> list[Row]:
+        """引用符で始まる行だけを表示するテキストとして扱う。"""
+        return [
+            tuple(
+                ContentItem(text, tuple(role.strip() for role in roles.split(",") if role.strip()))
+                for text, roles in ITEM_RE.findall(line)
+            )
+            for line in self._content_lines()
+            if line.startswith('"')
+        ]
+
+    def descriptions(self) -> list[str]:
+        """Content のうち、表示するテキストではない説明行。"""
+        return [line for line in self._content_lines() if not line.startswith('"')]
+
+    def mentions(self, *words: str) -> bool:
+        text = self.sections.get("Content", "") + self.sections.get("Visual Elements", "")
+        return any(word in text for word in words)
+
+
+@dataclass
+class Deck:
+    title: str
+    overview: dict[str, str]
+    slides: list[SlideSpec]
+    palette: dict[str, str]
+    font_sizes: dict[str, int]
+
+
+def parse_slides_md(text: str) -> Deck:
+    title = re.search(r"^# (.+)$", text, re.MULTILINE)
+    overview = dict(re.findall(r"^- \*\*(.+?)\*\*:\s*(.+)$", _section(text, "## Overview"), re.MULTILINE))
+
+    palette = dict(DEFAULT_PALETTE)
+    for role, color in re.findall(r"^\|\s*([^|]+?)\s*\|[^|]*\|\s*(#[0-9A-Fa-f]{6})\s*\|", text, re.MULTILINE):
+        if role in PALETTE_NAMES:
+            palette[PALETTE_NAMES[role]] = color.upper()
+
+    font_sizes = dict(DEFAULT_FONT_SIZES)
+    for level, size in re.findall(r"^\|\s*(Primary|Secondary|Tertiary)\s*\|\s*(\d+)", text, re.MULTILINE):
+        font_sizes[level] = int(size)
+
+    headings = list(SLIDE_HEADING_RE.finditer(text))
+    slides = []
+    for heading, next_heading in zip(headings, headings[1:] + [None]):
+        end = next_heading.start() if next_heading else len(text)
+        # 最後のスライドの後ろに続く Design Specification などは含めない
+        body = re.split(r"^---\s*$", text[heading.end() : end], flags=re.MULTILINE)[0]
+        spec = SlideSpec(heading[1], heading[2].strip())
+        if match := re.search(r"^\*\*Type\*\*:\s*(.+)$", body, re.MULTILINE):
+            spec.type = match[1].strip()
+        for name, section in re.findall(r"^### (.+?)\n(.*?)(?=^### |\Z)", body, re.MULTILINE | re.DOTALL):
+            spec.sections[name.strip()] = section.strip()
+        slides.append(spec)
+
+    return Deck(title[1].strip() if title else "", overview, slides, palette, font_sizes)
+
+
+def _section(text: str, heading: str) -> str:
+    start = text.find(heading)
+    if start < 0:
+        return ""
+    end = text.find("\n## ", start + len(heading))
+    return text[start : end if end >= 0 else len(text)]
+
+
+# ---- ビルダー ----
+
+
+def quote(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)
+
+
+class MethodWriter:
+    """生成するメソッド本体の行を組み立てる。"""
+
+    def __init__(self, font_sizes: dict[str, int]):
+        self.font_sizes = font_sizes
+        self.lines: list[str] = []
+
+    def emit(self, line: str = "") -> None:
+        self.lines.append(f"        {line}" if line else "")
+
+    def text(self, name: str, item: ContentItem, bold: bool | None = None) -> str:
+        level = item.level
+        color = "ACCENT" if item.accent else f"TEXT_{level.upper()}"
+        args = [quote(item.text), f"font_size={self.font_sizes[level]}", f"color={color}"]
+        if level == "Primary" if bold is None else bold:
+            args.append("weight=BOLD")
+        args.append(f"font={'FONT_CODE' if item.code else 'FONT_MAIN'}")
+        self.emit(f"{name} = cached_text({', '.join(args)})")
+        return name
+
+    def row(self, name: str, row: Row) -> str:
+        if len(row) == 1:
+            return self.text(name, row[0])
+        parts = [self.text(f"{name}_{i + 1}", item) for i, item in enumerate(row)]
+        self.emit(f"{name} = VGroup({', '.join(parts)}).arrange(RIGHT, buff=0.6)")
+        return name
+
+
+def split_rows(spec: SlideSpec) -> tuple[str | None, ContentItem | None, ContentItem | None, list[Row]]:
+    """(ステップ番号, セクションラベル, 見出し, 本文の行) に分ける。"""
+    step, label, heading, body = None, None, None, []
+    for row in spec.rows():
+        item = row[0]
+        if match := re.fullmatch(r"STEP (\d+)", item.text):
+            step = match[1]
+        elif len(row) == 1 and item.level == "Tertiary" and label is None and heading is None and not body:
+            label = item
+        elif len(row) == 1 and item.level == "Primary" and heading is None:
+            heading = item
+        else:
+            body.append(row)
+    return step, label, heading, body
+
+
+class Layout:
+    """上から ラベル → 見出し → 本文 の順に並べるスライドの骨組み。"""
+
+    def __init__(self, spec: SlideSpec, w: MethodWriter):
+        self.spec, self.w = spec, w
+        step, label, heading, self.body = split_rows(spec)
+        self.label = None
+        if step is not None:
+            w.emit(f"label = self.make_step_label({step})")
+            self.label = "label"
+        elif label is not None:
+            w.text("label", label, bold=True)
+            w.emit("label.to_edge(UP, buff=0.8)")
+            self.label = "label"
+        self.parts = [w.text("title", heading)] if heading is not None else []
+
+    def finish(self, progressive: str | None = None) -> None:
+        """``progressive`` に指定したグループは、slides.md が段階表示を求めていれば 1 つずつ表示する。"""
+        w = self.w
+        body = f"VGroup({', '.join(self.parts)}).arrange(DOWN, buff=0.5)"
+        if progressive is not None and self.spec.mentions(*PROGRESSIVE_WORDS):
+            # 配置だけが目的なので、使わない変数は作らない
+            if self.label is not None:
+                w.emit(f"body = {body}")
+                w.emit("VGroup(label, body).arrange(DOWN, buff=0.6)")
+            else:
+                w.emit(body)
+            static = ([self.label] if self.label else []) + [p for p in self.parts if p != progressive]
+            w.emit(f"self.switch_slide(VGroup({', '.join(static)}))")
+            w.emit(f"for item in {progressive}:")
+            w.emit("    self.play(FadeIn(item, shift=UP * 0.2), run_time=0.4)")
+        else:
+            w.emit(f"body = {body}")
+            if self.label is not None:
+                w.emit("content = VGroup(label, body).arrange(DOWN, buff=0.6)")
+            else:
+                w.emit("content = body")
+            w.emit("self.switch_slide(content)")
+
+
+def build_title(spec: SlideSpec, w: MethodWriter) -> None:
+    rows = spec.rows()
+    names = []
+    for i, row in enumerate(rows):
+        if row[0].level == "Primary" or i == 0:
+            names.append(w.row(f"title_{i + 1}", row))
+        else:
+            names.append(w.row(f"subtitle_{i + 1}", row))
+            w.emit(f"{names[-1]}.to_corner(DR, buff=0.8)")
+    w.emit(f"self.play({', '.join(f'FadeIn({name})' for name in names)})")
+
+
+def build_statement(spec: SlideSpec, w: MethodWriter) -> None:
+    names = [w.row(f"line_{i + 1}", row) for i, row in enumerate(spec.rows())]
+    w.emit(f"content = VGroup({', '.join(names)}).arrange(DOWN, buff=0.5)")
+    w.emit("self.switch_slide(content)")
+
+
+def build_list(spec: SlideSpec, w: MethodWriter) -> None:
+    layout = Layout(spec, w)
+    names = [w.row(f"item_{i + 1}", row) for i, row in enumerate(layout.body)]
+    if not names:
+        layout.finish()
+        return
+    w.emit(f"items = VGroup({', '.join(names)}).arrange(DOWN, buff=0.4, aligned_edge=LEFT)")
+    layout.parts.append("items")
+    layout.finish(progressive="items")
+
+
+def _window(w: MethodWriter, name: str, lines: list[str], width: float) -> None:
+    """ウィンドウバー付きの角丸四角に ``lines`` を左揃えで入れる。"""
+    w.emit(f"{name}_bg = RoundedRectangle(")
+    w.emit(f"    corner_radius=0.15, width={width}, height={0.9 + 0.5 * len(lines):.1f},")
+    w.emit('    color=TEXT_SECONDARY, fill_opacity=0.05, fill_color="#2C2C2E",')
+    w.emit(")")
+    red, yellow, green = (quote(color) for color in WINDOW_DOT_COLORS)
+    w.emit(f"dot_red = Dot(radius=0.05, color={red}).move_to({name}_bg.get_corner(UL) + RIGHT * 0.35 + DOWN * 0.25)")
+    w.emit(f"dot_yellow = Dot(radius=0.05, color={yellow}).next_to(dot_red, RIGHT, buff=0.12)")
+    w.emit(f"dot_green = Dot(radius=0.05, color={green}).next_to(dot_yellow, RIGHT, buff=0.12)")
+    w.emit(f"{name}_lines = VGroup({', '.join(lines)}).arrange(DOWN, buff=0.25, aligned_edge=LEFT)")
+    w.emit(f"{name}_lines.move_to({name}_bg).shift(DOWN * 0.15)")
+    w.emit(f"{name}_lines.align_to({name}_bg.get_left() + RIGHT * 0.4, LEFT)")
+    w.emit(f"{name} = VGroup({name}_bg, dot_red, dot_yellow, dot_green, {name}_lines)")
+
+
+def build_terminal(spec: SlideSpec, w: MethodWriter) -> None:
+    layout = Layout(spec, w)
+    lines, rest = [], []
+    for row in layout.body:
+        item = row[0]
+        if not item.text.startswith("$"):
+            rest.append(row)
+            continue
+        i = len(lines) + 1
+        w.text(f"prompt_{i}", ContentItem("$", item.roles + ("Accent",)))
+        w.text(f"command_{i}", ContentItem(item.text.removeprefix("$").strip(), item.roles + ("コマンド",)))
+        w.emit(f"line_{i} = VGroup(prompt_{i}, command_{i}).arrange(RIGHT, buff=0.2)")
+        lines.append(f"line_{i}")
+    _window(w, "terminal", lines, 10.0)
+    layout.parts.append("terminal")
+    layout.parts += [w.row(f"note_{i + 1}", row) for i, row in enumerate(rest)]
+    layout.finish()
+
+
+def build_browser(spec: SlideSpec, w: MethodWriter) -> None:
+    layout = Layout(spec, w)
+    lines, rest = [], []
+    for row in layout.body:
+        mark, _, label = row[0].text.partition(" ")
+        if mark not in CHECK_MARKS:
+            rest.append(row)
+            continue
+        i = len(lines) + 1
+        color = "ACCENT" if mark == "!" else "TEXT_PRIMARY"
+        w.emit(f"mark_{i} = cached_text({quote(mark)}, font_size=20, color={color}, weight=BOLD, font=FONT_MAIN)")
+        w.emit(f"check_{i} = cached_text({quote(label.strip())}, font_size=20, color=TEXT_PRIMARY, font=FONT_MAIN)")
+        w.emit(f"line_{i} = VGroup(mark_{i}, check_{i}).arrange(RIGHT, buff=0.3)")
+        lines.append(f"line_{i}")
+    _window(w, "browser", lines, 9.0)
+    layout.parts.append("browser")
+    layout.parts += [w.row(f"note_{i + 1}", row) for i, row in enumerate(rest)]
+    layout.finish()
+
+
+BUILDERS: dict[str, Callable[[SlideSpec, MethodWriter], None]] = {
+    "title": build_title,
+    "statement": build_statement,
+    "list": build_list,
+    "terminal": build_terminal,
+    "browser": build_browser,
+}
+
+
+def classify(spec: SlideSpec) -> str:
+    """スライドの Type と内容からビルダーを選ぶ。"""
+    rows = spec.rows()
+    if spec.type.lower().startswith("title"):
+        return "title"
+    if any(row[0].text.partition(" ")[0] in CHECK_MARKS for row in rows):
+        return "browser"
+    if any(row[0].text.startswith("$") for row in rows):
+        return "terminal"
+    if rows and all(item.level == "Primary" for row in rows for item in row):
+        return "statement"
+    return "list"
+
+
+def generate_method(spec: SlideSpec, font_sizes: dict[str, int] = DEFAULT_FONT_SIZES) -> str:
+    w = MethodWriter(font_sizes)
+    for description in spec.descriptions():
+        w.emit(f"# slides.md: {description}")
+    BUILDERS[classify(spec)](spec, w)
+    return "\n".join(
+        [
+            f"    # ---- Slide {spec.number}: {spec.title} [slides.md {spec.content_hash}] ----",
+            f"    @slide(notes={quote(spec.notes)})",
+            f"    def {spec.method_name}(self):",
+            *w.lines,
+        ]
+    ) + "\n"
+
+
+def generate_module(deck: Deck, scene: str) -> str:
+    constants = "\n".join(f"{name} = {quote(color)}" for name, color in deck.palette.items())
+    methods = "\n".join(generate_method(spec, deck.font_sizes) for spec in deck.slides)
+    return f'''from manim import *
+
+from slidekit import IncrementalSlide, SlideNumberOverlay, cached_text, slide
+
+# slides.md: {deck.title}
+# Key Message: {deck.overview.get("Key Message", "")}
+{constants}
+FONT_MAIN = "Hiragino Kaku Gothic Pro"
+FONT_CODE = "Menlo"
+
+
+class {scene}(SlideNumberOverlay, IncrementalSlide):
+
+    def make_slide_number(self, number):
+        return cached_text(str(number), font_size=18, color=TEXT_TERTIARY, font=FONT_MAIN).to_corner(DR)
+
+    def make_step_label(self, number):
+        return cached_text(
+            f"STEP {{number}}", font_size=18, color=TEXT_TERTIARY, weight=BOLD, font=FONT_MAIN,
+        ).to_edge(UP, buff=0.8)
+
+    def switch_slide(self, new_content):
+        for m in list(self.mobjects_without_canvas):
+            self.remove(m)
+        self.add(new_content)
+        # manim-slides はアニメーションのないスライドを作れないため、まだアニメーションが
+        # なければ静止フレームを出力する（あれば next_slide() が待ち時間を入れる）
+        if self._current_animation == self._start_animation:
+            self.wait(0.1)
+
+    def construct(self):
+        self.camera.background_color = ManimColor(BG_COLOR)
+        self.play_slides()
+        self.next_slide()
+
+{methods}'''
+
+
+# ---- インクリメンタル更新 ----
+
+
+@dataclass
+class Block:
+    """既存ファイル中の生成済みメソッド（マーカー行からメソッドの最終行まで）。"""
+
+    start: int
+    end: int
+    hash: str
+    function: ast.FunctionDef
+
+
+def find_blocks(source: str) -> dict[str, Block]:
+    lines = source.splitlines()
+    blocks = {}
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.FunctionDef) or not node.decorator_list:
+            continue
+        first = min(decorator.lineno for decorator in node.decorator_list) - 1
+        if first > 0 and (match := MARKER_RE.match(lines[first - 1])):
+            blocks[match[1]] = Block(first - 1, node.end_lineno, match[2], node)
+    return blocks
+
+
+@dataclass
+class CompileResult:
+    source: str
+    generated: list[str] = field(default_factory=list)
+    notes_updated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def update_module(source: str, deck: Deck) -> CompileResult:
+    """既存の presentation.py のうち、変更のあったスライドだけを生成し直す。"""
+    blocks = find_blocks(source)
+    result = CompileResult(source)
+    lines = source.splitlines(keepends=True)
+
+    texts: dict[str, str] = {}
+    for spec in deck.slides:
+        block = blocks.get(spec.number)
+        if block is None or block.hash != spec.content_hash:
+            result.generated.append(spec.number)
+            texts[spec.number] = generate_method(spec, deck.font_sizes)
+            continue
+        # 生成済みで内容が変わっていないメソッドは、手での修正も含めてそのまま使う
+        raw = [line.encode() for line in lines[block.start : block.end]]
+        if replace_notes(raw, block, spec.notes):
+            result.notes_updated.append(spec.number)
+        else:
+            result.unchanged.append(spec.number)
+        texts[spec.number] = b"".join(raw).decode()
+    result.removed = [number for number in blocks if number not in texts]
+
+    order = [spec.number for spec in deck.slides]
+    existing = [number for number in sorted(blocks, key=lambda n: blocks[n].start) if number in texts]
+    in_order = existing == [number for number in order if number in blocks]
+
+    # 後ろから置き換えて行番号がずれないようにする
+    edits: list[tuple[int, int, str]] = []
+    if in_order:
+        for number, block in blocks.items():
+            edits.append((block.start, block.end, texts.get(number, "")))
+        anchor = min((block.start for block in blocks.values()), default=len(lines))
+        for i, number in enumerate(order):
+            if number in blocks:
+                continue
+            previous = next((n for n in reversed(order[:i]) if n in blocks), None)
+            if previous is None:
+                edits.append((anchor, anchor, texts[number] + "\n"))
+            else:
+                edits.append((blocks[previous].end, blocks[previous].end, "\n" + texts[number]))
+    else:
+        # 並び順が変わったときは、生成済みメソッドをまとめて最初の位置に並べ直す
+        first = min(block.start for block in blocks.values())
+        for block in blocks.values():
+            edits.append((block.start, block.end, ""))
+        edits.append((first, first, "\n".join(texts[number] for number in order)))
+
+    for start, end, text in sorted(edits, key=lambda edit: (edit[0], edit[1]), reverse=True):
+        if not text and start > 0 and not lines[start - 1].strip():
+            start -= 1
+        lines[start:end] = [text] if text else []
+    result.source = "".join(lines)
+    return result
+
+
+def replace_notes(raw: list[bytes], block: Block, notes: str) -> bool:
+    """ブロック内の ``@slide(notes=...)`` の引数を書き換える。書き換えたら ``True``。
+
+    ``col_offset`` は UTF-8 のバイト単位なので、行はバイト列で受け取る。
+    """
+    for decorator in block.function.decorator_list:
+        if not isinstance(decorator, ast.Call):
+            continue
+        for keyword in decorator.keywords:
+            value = keyword.value
+            if keyword.arg != "notes" or not isinstance(value, ast.Constant):
+                continue
+            if value.value == notes or value.lineno != value.end_lineno:
+                return False
+            row = value.lineno - 1 - block.start
+            line = raw[row]
+            raw[row] = line[: value.col_offset] + quote(notes).encode() + line[value.end_col_offset :]
+            return True
+    return False
+
+
+def compile_slides(slides_md: Path, output: Path, scene: str, force: bool = False) -> CompileResult:
+    deck = parse_slides_md(slides_md.read_text(encoding="utf-8"))
+    if not output.exists():
+        source = generate_module(deck, scene)
+        return CompileResult(source, generated=[spec.number for spec in deck.slides])
+
+    source = output.read_text(encoding="utf-8")
+    if not find_blocks(source):
+        if not force:
+            raise SystemExit(
+                f"{output} has no slides generated from slides.md; use --force to overwrite it"
+            )
+        return CompileResult(generate_module(deck, scene), generated=[spec.number for spec in deck.slides])
+    return update_module(source, deck)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("slides_md", type=Path, nargs="?", default=Path("slides.md"))
+    parser.add_argument("-o", "--output", type=Path, default=Path("presentation.py"))
+    parser.add_argument("--scene", default="Presentation")
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    result = compile_slides(args.slides_md, args.output, args.scene, force=args.force)
+    if not args.output.exists() or args.output.read_text(encoding="utf-8") != result.source:
+        args.output.write_text(result.source, encoding="utf-8")
+    print(
+        f"{args.output}: {len(result.generated)} generated, {len(result.notes_updated)} notes updated, "
+        f"{len(result.unchanged)} unchanged, {len(result.removed)} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+動画を base64 で埋め込まない HTML エクスポート。
+
+``manim-slides convert --one-file`` は各スライドの動画を base64 で HTML に埋め込むので、
+サイズが約 1.33 倍になり、ブラウザは巨大な DOM を一度に読み込むことになる。
+ここでは小さな HTML と、全スライドの動画を連結した 1 つのメディアパックを書き出す。
+HTML にはパック内のオフセットと長さの索引だけを埋め込み、ブラウザは現在のスライドと
+次のスライドの動画だけを Range リクエストで取得する。離れたスライドの動画は解放する。
+
+    uv run python -m slidekit.html_export export ClaudeCodeManimSlides output.html
+    uv run python -m slidekit.html_export serve . --port 8000
+
+Range リクエストには HTTP サーバーが必要（``file://`` では動画を読み込めない）。
+``serve`` は Range に対応した簡易サーバーを起動する。
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.server
+import mimetypes
+import os
+import re
+import shutil
+import urllib.request
+from functools import partial
+from pathlib import Path
+
+from jinja2 import Template
+from manim import logger
+from manim_slides.config import PresentationConfig
+from manim_slides.convert import RevealJS, get_duration_ms
+from manim_slides.defaults import FOLDER_PATH
+from pydantic import Field
+
+# (オフセット, 長さ, MIME タイプ)
+PackEntry = tuple[int, int, str]
+
+LOADER_TEMPLATE = """
+    <script>
+      // メディアパックから現在と次のスライドの動画だけを取得し、離れたスライドの動画は解放する
+      (() => {
+        const pack = {{ pack_url | tojson }};
+        const index = {{ index | tojson }};
+        const urls = new Map();
+        let whole = null;
+
+        async function fetchEntry(i) {
+          const [offset, length, type] = index[i];
+          if (!whole) {
+            const response = await fetch(pack, { headers: { Range: `bytes=${offset}-${offset + length - 1}` } });
+            if (response.status === 206) {
+              return new Blob([await response.arrayBuffer()], { type });
+            }
+            // Range に対応していないサーバーでは、最初に届いたパック全体を保持して以降も切り出す
+            if (whole) {
+              response.body?.cancel();
+            } else {
+              whole = response.blob().catch((error) => {
+                whole = null;
+                throw error;
+              });
+            }
+          }
+          return (await whole).slice(offset, offset + length, type);
+        }
+
+        const isPacked = (slide) => slide.hasAttribute("data-pack-video");
+        const packIndex = (slide) => Number(slide.getAttribute("data-pack-video"));
+
+        function isWanted(slide) {
+          const slides = Reveal.getSlides().filter(isPacked);
+          const k = slides.indexOf(slide);
+          const current = slides.indexOf(Reveal.getCurrentSlide());
+          return k === current || k === current + 1;
+        }
+
+        async function attach(slide) {
+          const i = packIndex(slide);
+          if (!urls.has(i)) urls.set(i, fetchEntry(i).then((blob) => URL.createObjectURL(blob)));
+          const pending = urls.get(i);
+          let url;
+          try {
+            url = await pending;
+          } catch (error) {
+            if (urls.get(i) === pending) urls.delete(i);
+            throw error;
+          }
+          // 待っている間に解放された URL や、離れてしまったスライドには設定しない
+          if (urls.get(i) !== pending || !isWanted(slide)) return;
+          if (slide.getAttribute("data-background-video") === url) return;
+          slide.setAttribute("data-background-video", url);
+          Reveal.syncSlide(slide);
+          if (slide === Reveal.getCurrentSlide()) {
+            slide.slideBackgroundContentElement?.querySelector("video")?.play();
+          }
+        }
+
+        function detach(slide) {
+          if (!slide.hasAttribute("data-background-video")) return;
+          slide.removeAttribute("data-background-video");
+          Reveal.syncSlide(slide);
+        }
+
+        function update() {
+          const slides = Reveal.getSlides().filter(isPacked);
+          const current = slides.indexOf(Reveal.getCurrentSlide());
+          const keep = new Set();
+          slides.forEach((slide, k) => {
+            if (k === current || k === current + 1) {
+              keep.add(packIndex(slide));
+              attach(slide).catch((error) => console.error("media pack:", error));
+            } else if (k !== current - 1) {
+              detach(slide);
+            } else {
+              keep.add(packIndex(slide));
+            }
+          });
+          for (const [i, url] of urls) {
+            if (!keep.has(i)) {
+              urls.delete(i);
+              url.then((u) => URL.revokeObjectURL(u), () => {});
+            }
+          }
+        }
+
+        Reveal.on("ready", update);
+        Reveal.on("slidechanged", update);
+      })();
+    </script>
+"""
+
+
+def write_media_pack(files: list[Path], dest: Path) -> dict[Path, PackEntry]:
+    """``files`` を ``dest`` に連結し、ファイルごとのオフセットと長さを返す。同じファイルは 1 回だけ書く。"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    entries: dict[Path, PackEntry] = {}
+    offset = 0
+    with open(dest, "wb") as pack:
+        for file in files:
+            if file in entries:
+                continue
+            with open(file, "rb") as f:
+                shutil.copyfileobj(f, pack)
+            length = file.stat().st_size
+            mime_type = mimetypes.guess_type(file)[0] or "video/mp4"
+            entries[file] = (offset, length, mime_type)
+            offset += length
+    return entries
+
+
+def download_assets(content: str, assets_dir: Path, full_assets_dir: Path) -> str:
+    """HTML が参照するリモートの CSS / JS をアセットフォルダーに置き、参照を書き換える。"""
+    links = re.findall(r'<(?:link|script)\b[^>]*?(?:href|src)="(https?://[^"]+)"', content)
+    for link in sorted(set(links)):
+        name = link.rsplit("/", 1)[1]
+        target = full_assets_dir / name
+        if not target.exists():
+            full_assets_dir.mkdir(parents=True, exist_ok=True)
+            with urllib.request.urlopen(link, timeout=30) as response:
+                target.write_bytes(response.read())
+        content = content.replace(f'"{link}"', f'"{(assets_dir / name).as_posix()}"')
+    return content
+
+
+class PackedRevealJS(RevealJS):
+    """
+    メディアパックを使う RevealJS コンバーター。
+
+    ``one_file`` は無視する。``offline`` を指定すると RevealJS のアセットを
+    アセットフォルダーにダウンロードする（ダウンロード済みのものは再利用する）。
+    """
+
+    pack_name: str = Field("media.pack", description="Media pack file name inside the assets folder.")
+
+    def convert_to(self, dest: Path) -> None:
+        dirname = dest.parent
+        assets_dir = Path(
+            self.assets_dir.format(dirname=dirname, basename=dest.stem, ext=dest.suffix)
+        )
+        full_assets_dir = dirname / assets_dir
+
+        files = [
+            slide_config.file
+            for presentation_config in self.presentation_configs
+            for slide_config in presentation_config.slides
+        ]
+        entries = write_media_pack(files, full_assets_dir / self.pack_name)
+        numbers = {file: i for i, file in enumerate(entries)}
+
+        options = self.model_dump()
+        options["one_file"] = True
+        options["assets_dir"] = assets_dir
+        has_notes = any(
+            slide_config.notes != ""
+            for presentation_config in self.presentation_configs
+            for slide_config in presentation_config.slides
+        )
+        content = Template(self.load_template(), trim_blocks=True, lstrip_blocks=True).render(
+            file_to_data_uri=lambda file: f"pack:{numbers[file]}",
+            get_duration_ms=get_duration_ms,
+            has_notes=has_notes,
+            env=os.environ,
+            prefix=None,
+            **options,
+        )
+        # 背景は読み込み時に設定するので、最初は索引番号だけを持たせる
+        content = re.sub(r'data-background-video="pack:(\d+)"', r'data-pack-video="\1"', content)
+
+        loader = Template(LOADER_TEMPLATE).render(
+            pack_url=(assets_dir / self.pack_name).as_posix(), index=list(entries.values())
+        )
+        content = content.replace("</body>", loader + "  </body>", 1)
+
+        if self.offline:
+            content = download_assets(content, assets_dir, full_assets_dir)
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(content, encoding="utf-8")
+        logger.info(f"Wrote '{dest}' and a {len(entries)}-entry media pack in '{full_assets_dir}'")
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """``Range: bytes=start-end`` に対応した SimpleHTTPRequestHandler。"""
+
+    def send_head(self):
+        self.range_length = None
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        path = Path(self.translate_path(self.path))
+        if match is None or not path.is_file():
+            return super().send_head()
+
+        size = path.stat().st_size
+        start = int(match[1])
+        end = min(int(match[2]) if match[2] else size - 1, size - 1)
+        if start > end:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.end_headers()
+            return None
+
+        f = open(path, "rb")
+        f.seek(start)
+        self.range_length = end - start + 1
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(self.range_length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile) -> None:
+        if self.range_length is None:
+            return super().copyfile(source, outputfile)
+        remaining = self.range_length
+        while remaining > 0:
+            chunk = source.read(min(remaining, 1 << 16))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="Write an HTML shell and a media pack.")
+    export.add_argument("scenes", nargs="+")
+    export.add_argument("dest", type=Path)
+    export.add_argument("--folder", type=Path, default=FOLDER_PATH)
+    export.add_argument("--title", default="Manim Slides")
+    export.add_argument("--offline", action="store_true")
+
+    serve = subparsers.add_parser("serve", help="Serve a directory with Range support.")
+    serve.add_argument("directory", type=Path, nargs="?", default=Path("."))
+    serve.add_argument("--bind", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+
+    args = parser.parse_args()
+    if args.command == "export":
+        presentation_configs = [
+            PresentationConfig.from_file(args.folder / f"{scene}.json") for scene in args.scenes
+        ]
+        PackedRevealJS(
+            presentation_configs=presentation_configs, title=args.title, offline=args.offline
+        ).convert_to(args.dest)
+    else:
+        handler = partial(RangeRequestHandler, directory=str(args.directory))
+        with http.server.ThreadingHTTPServer((args.bind, args.port), handler) as server:
+            print(f"Serving {args.directory} on http://{args.bind}:{args.port}/")
+            server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+スライド単位のインクリメンタルレンダリング。
+
+``@slide`` で登録したメソッドごとにキャッシュキーを計算し、キーが変わっていない
+スライドは前回レンダリングした動画を ``next_slide(src=...)`` で差し込む。
+スライド本体は ``skip_animations=True`` のセクションで実行するため、Canvas などの
+状態は進むがフレームは一切エンコードされない。
+
+    SLIDEKIT_INCREMENTAL=1 uv run manim-slides render presentation.py ClaudeCodeManimSlides
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import manim_slides
+from manim import config, logger
+from manim_slides import Slide
+from manim_slides.config import PresentationConfig
+from manim_slides.utils import merge_basenames
+
+from .render_cache import digest, render_settings
+
+SLIDE_CONFIG_ATTR = "_slide_config"
+
+
+def slide(**slide_config: Any) -> Callable:
+    """メソッドをスライドとして登録する。引数はそのまま ``next_slide()`` に渡す。"""
+
+    def decorator(method: Callable) -> Callable:
+        setattr(method, SLIDE_CONFIG_ATTR, slide_config)
+        return method
+
+    return decorator
+
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() not in ("", "0", "false", "no")
+
+
+def dependency_digest(module: Any) -> str:
+    """
+    ``module`` が参照する標準ライブラリ以外のモジュールのダイジェストを返す。
+
+    デッキと同じディレクトリにあるパッケージ（``slidekit`` など）はソースを、
+    それ以外（manim など）はバージョンを含める。
+    """
+    root = Path(module.__file__).resolve().parent
+    packages = set()
+    for value in vars(module).values():
+        name = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+        if isinstance(name, str):
+            packages.add(name.partition(".")[0])
+    packages -= {module.__name__, "__main__", "builtins", *sys.stdlib_module_names}
+
+    parts = []
+    for name in sorted(packages):
+        package = sys.modules.get(name)
+        file = getattr(package, "__file__", None)
+        if file is None:
+            continue
+        path = Path(file).resolve()
+        if not path.is_relative_to(root):
+            parts.append(f"{name}=={getattr(package, '__version__', '')}")
+            continue
+        files = sorted(path.parent.rglob("*.py")) if path.name == "__init__.py" else [path]
+        for source in files:
+            parts += [source.relative_to(root).as_posix(), source.read_text(encoding="utf-8")]
+    return digest(*parts)
+
+
+class IncrementalSlide(Slide):
+    """
+    ``@slide`` メソッドを定義順に再生する Slide。
+
+    スライド k のキーは「共通部分（定数・ヘルパー・依存モジュール・品質設定）」
+    「スライド番号」「スライド k のソースと notes」「スライド k-1 のキー」から作る。
+    スライド k の動画はスライド k-1 の最終フレームから始まるので、直前のスライドの
+    キーを連鎖させ、それより前のスライドの変更も後続のスライドに伝わるようにする。
+
+    :cvar incremental: 変更のないスライドを再利用する。
+        環境変数 ``SLIDEKIT_INCREMENTAL=1`` でも有効になる。
+    :cvar slide_range: ``(first, last)`` を指定すると、その範囲のスライドだけを
+        レンダリングする（1 始まり、両端を含む）。並列レンダリングで使う。
+    """
+
+    incremental: bool = env_flag("SLIDEKIT_INCREMENTAL")
+    slide_range: tuple[int, int] | None = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._slide_keys: dict[int, str] = {}
+
+    @classmethod
+    def slide_methods(cls) -> list[Callable]:
+        """登録済みのスライドメソッドを定義順に返す。"""
+        methods: dict[str, Callable] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if hasattr(attr, SLIDE_CONFIG_ATTR):
+                    methods[name] = attr
+        return list(methods.values())
+
+    @property
+    def slide_cache_dir(self) -> Path:
+        return Path(config.media_dir) / "slide_cache" / str(self)
+
+    @property
+    def incremental_enabled(self) -> bool:
+        return (
+            self.incremental
+            and not (config["disable_caching"] or self.disable_caching)
+            and not self._start_at_animation_number
+        )
+
+    def slide_context(self) -> str:
+        """全スライドに影響する要素のダイジェストを返す。"""
+        module = inspect.getmodule(type(self))
+        constants = sorted(
+            (name, repr(value))
+            for name, value in vars(module).items()
+            if name.isupper() and isinstance(value, (str, int, float, tuple))
+        )
+        helpers = [
+            inspect.getsource(attr)
+            for klass in type(self).__mro__
+            if klass.__module__ == type(self).__module__
+            for attr in vars(klass).values()
+            if inspect.isfunction(attr) and not hasattr(attr, SLIDE_CONFIG_ATTR)
+        ]
+        return digest(
+            render_settings(),
+            manim_slides.__version__,
+            dependency_digest(module),
+            repr(constants),
+            *helpers,
+        )
+
+    def play_slides(self) -> None:
+        """登録済みのスライドを順に再生する。"""
+        context = self.slide_context() if self.incremental_enabled else ""
+        previous = ""
+        for index, method in enumerate(self.slide_methods(), start=1):
+            slide_config = getattr(method, SLIDE_CONFIG_ATTR)
+            source = digest(inspect.getsource(method), repr(sorted(slide_config.items())))
+            key = digest(context, str(index), previous, source)
+            previous = key
+
+            if self.slide_range is not None:
+                first, last = self.slide_range
+                if index > last:
+                    break
+                if index < first - 1:
+                    self.fast_forward_slide(index, method)
+                    continue
+                if index == first - 1:
+                    # 範囲の最初のスライドは直前のスライドの最終フレームから始まる
+                    self.next_slide(skip_animations=True)
+                    method(self)
+                    continue
+
+            cached = self.slide_cache_dir / f"{key}{config.movie_file_extension}"
+            if self.incremental_enabled and self._fetch_slide(cached):
+                logger.info(f"Slide {index} ({method.__name__}): reusing {cached}")
+                self.next_slide(src=cached, **slide_config)
+                # 本体はフレームを出力せずに実行し、Canvas などの状態だけ進める
+                self.next_slide(skip_animations=True)
+            else:
+                self.next_slide(**slide_config)
+                self._slide_keys[self._current_animation] = key
+
+            method(self)
+
+    def _fetch_slide(self, cached: Path) -> bool:
+        """スライド動画がローカルになければ共有キャッシュから取得する。"""
+        if cached.exists():
+            return True
+        render_cache = getattr(self, "render_cache", None)
+        if render_cache is None or not render_cache.get(f"slides/{cached.name}", cached):
+            return False
+        rev_cached = cached.with_name(f"{cached.stem}_reversed{cached.suffix}")
+        render_cache.get(f"slides/{rev_cached.name}", rev_cached)
+        return True
+
+    def fast_forward_slide(self, index: int, method: Callable) -> None:
+        """
+        ``slide_range`` より前のスライドを出力せずに通過する。
+
+        デフォルトではスライド本体をスキップ区間で実行する。Canvas の状態を
+        直接復元できるサブクラスは、これを上書きして本体の実行を省略できる。
+        """
+        self.next_slide(skip_animations=True)
+        method(self)
+
+    def _save_slides(
+        self,
+        use_cache: bool = True,
+        flush_cache: bool = False,
+        skip_reversing: bool = False,
+    ) -> None:
+        if self.incremental_enabled and use_cache and not flush_cache:
+            self._restore_reversed_files()
+
+        super()._save_slides(
+            use_cache=use_cache,
+            flush_cache=flush_cache,
+            skip_reversing=skip_reversing,
+        )
+
+        if self.incremental_enabled:
+            self._store_rendered_slides()
+
+    def _restore_reversed_files(self) -> None:
+        """キャッシュ済みの逆再生動画を配置し、manim-slides の再生成を省く。"""
+        scene_files_folder = self._output_folder / "files" / str(self)
+        scene_files_folder.mkdir(parents=True, exist_ok=True)
+
+        for pre_slide in self._slides:
+            if pre_slide.src is None or pre_slide.src.parent != self.slide_cache_dir:
+                continue
+            src = pre_slide.src
+            rev_cached = src.with_name(f"{src.stem}_reversed{src.suffix}")
+            dst = merge_basenames([src])
+            rev_dst = scene_files_folder / f"{dst.stem}_reversed{dst.suffix}"
+            if rev_cached.exists() and not rev_dst.exists():
+                shutil.copy(rev_cached, rev_dst)
+
+    def _store_rendered_slides(self) -> None:
+        """今回レンダリングしたスライドの動画をキーごとに保存する。"""
+        presentation = PresentationConfig.from_file(self._output_folder / f"{self}.json")
+        pre_slides = [s for s in self._slides if not s.skip_animations]
+
+        render_cache = getattr(self, "render_cache", None)
+        self.slide_cache_dir.mkdir(parents=True, exist_ok=True)
+        for pre_slide, slide_config in zip(pre_slides, presentation.slides):
+            if pre_slide.src is not None:
+                continue
+            key = self._slide_keys.get(pre_slide.start_animation)
+            if key is None:
+                continue
+            suffix = slide_config.file.suffix
+            stored = {self.slide_cache_dir / f"{key}{suffix}": slide_config.file}
+            if slide_config.rev_file != slide_config.file:
+                stored[self.slide_cache_dir / f"{key}_reversed{suffix}"] = slide_config.rev_file
+            for dst, src in stored.items():
+                shutil.copy(src, dst)
+                if render_cache is not None:
+                    render_cache.put(f"slides/{dst.name}", dst)
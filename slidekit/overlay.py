@@ -0,0 +1,96 @@
+"""
+スライド番号のオーバーレイ。
+
+スライド番号を Canvas に置いて毎スライド ``Transform`` すると、番号を変えるだけの
+アニメーションが 1 スライドにつき 1 本レンダリングされる。ここでは番号を
+シーンから外し、ファイルライターに渡る各フレームに焼き込む。番号の画像は番号ごとに
+一度だけラスタライズし、以降は小さなパッチのアルファ合成だけで済ませる。
+エンコードは通常どおり 1 回だけで、逆再生動画も合成済みのフレームから作られるので、
+present / HTML / PPTX / PDF のどれにも番号が出る。
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable
+
+import numpy as np
+from manim import Mobject
+from manim.camera.camera import Camera
+
+# (top, left, 乗算済みアルファの RGBA パッチ)
+Raster = tuple[int, int, np.ndarray]
+
+
+def rasterize(mobject: Mobject) -> Raster | None:
+    """
+    フレーム上の位置そのままにモブジェクトを描画し、不透明な部分だけ切り出す。
+
+    空文字列やフレーム外のモブジェクトのように 1 ピクセルも描かれない場合は ``None``。
+    """
+    camera = Camera(background_opacity=0)
+    camera.capture_mobject(mobject)
+    pixels = camera.pixel_array
+    rows, cols = np.nonzero(pixels[..., 3])
+    if rows.size == 0:
+        return None
+    top, bottom = rows.min(), rows.max() + 1
+    left, right = cols.min(), cols.max() + 1
+    return int(top), int(left), pixels[top:bottom, left:right].copy()
+
+
+def composite(frame: np.ndarray, raster: Raster) -> np.ndarray:
+    """``frame`` の複製に ``raster`` を合成して返す。"""
+    top, left, patch = raster
+    height, width = patch.shape[:2]
+    # Cairo の出力は乗算済みアルファ
+    alpha = patch[..., 3:].astype(np.float32) / 255
+    frame = frame.copy()
+    region = frame[top : top + height, left : left + width]
+    region[:] = (patch + region * (1 - alpha)).round().astype(np.uint8)
+    return frame
+
+
+class SlideNumberOverlay:
+    """
+    ファイルライターに渡るフレームにスライド番号を焼き込む Slide 用ミックスイン。
+
+    番号は出力するスライドの順に 1 から振る（``slide_range`` があればその先頭から）。
+    サブクラスは :meth:`make_slide_number` で番号のモブジェクトを返す。
+
+    manim の部分動画のハッシュには番号が含まれないので、番号をカメラの属性として
+    ハッシュに含め、別の番号のスライドで部分動画が再利用されないようにする。
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        file_writer = self.renderer.file_writer
+        file_writer.write_frame = partial(self._write_numbered_frame, file_writer.write_frame)
+
+    def make_slide_number(self, number: int) -> Mobject:
+        raise NotImplementedError
+
+    def slide_number_raster(self, number: int) -> Raster | None:
+        rasters = self.__dict__.setdefault("_slide_number_rasters", {})
+        if number not in rasters:
+            rasters[number] = rasterize(self.make_slide_number(number))
+        return rasters[number]
+
+    def current_slide_number(self) -> int:
+        slide_range = getattr(self, "slide_range", None)
+        first = slide_range[0] if slide_range else 1
+        return first + sum(not pre_slide.skip_animations for pre_slide in self._slides)
+
+    def play(self, *args: Any, **kwargs: Any) -> None:
+        # カメラの属性は get_hash_from_play_call でハッシュされる
+        self.camera.slide_number = self.current_slide_number()
+        super().play(*args, **kwargs)
+
+    def _write_numbered_frame(
+        self, write_frame: Callable, frame_or_renderer: Any, num_frames: int = 1
+    ) -> None:
+        if isinstance(frame_or_renderer, np.ndarray):
+            raster = self.slide_number_raster(self.current_slide_number())
+            if raster is not None:
+                frame_or_renderer = composite(frame_or_renderer, raster)
+        write_frame(frame_or_renderer, num_frames)
@@ -0,0 +1,155 @@
+"""
+スライドを複数プロセスで並列にレンダリングする。
+
+デッキを ``next_slide()`` の境界（``@slide`` メソッド単位）で分割し、各スライドを
+別プロセスで ``slide_range=(k, k)`` としてレンダリングする。最後に各プロセスの
+スライド設定を順番につなぎ、``manim-slides render`` と同じ
+``slides/<Scene>.json`` と ``slides/files/<Scene>/`` を書き出す。
+
+    uv run python -m slidekit.parallel presentation.py ClaudeCodeManimSlides -j 32 -q h
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import config, logger
+from manim._config.utils import ManimConfig
+from manim.constants import QUALITIES
+from manim.utils.module_ops import get_module
+from manim_slides.config import PresentationConfig
+from manim_slides.defaults import FOLDER_PATH
+
+QUALITY_FLAGS = {quality["flag"]: name for name, quality in QUALITIES.items() if quality["flag"]}
+
+
+def load_scene_class(file: Path, scene_name: str) -> type:
+    return getattr(get_module(file), scene_name)
+
+
+def render_segment(
+    file: Path,
+    scene_name: str,
+    first: int,
+    last: int,
+    quality: str,
+    folder: Path,
+    settings: ManimConfig,
+) -> Path:
+    """
+    スライド ``first``〜``last`` をレンダリングし、スライド設定のパスを返す。
+
+    spawn したプロセスは呼び出し側の設定を引き継がないので ``settings`` を写す。
+    部分動画のディレクトリを共有すると manim のキャッシュ掃除が他のセグメントの
+    ファイルまで消すため、``media_dir`` の下にセグメントごとのディレクトリを切る。
+    """
+    config.update(settings)
+    config.media_dir = Path(settings.media_dir) / "parallel" / scene_name / f"{first:03}"
+    config.input_file = file
+    config.quality = quality
+    config.output_file = f"{scene_name}_{first:03}"
+
+    scene = load_scene_class(file, scene_name)(output_folder=folder)
+    scene.slide_range = (first, last)
+    scene.render()
+    return folder / f"{scene_name}.json"
+
+
+def stitch_segments(scene_name: str, segments: list[Path], output_folder: Path) -> Path:
+    """各セグメントのスライド設定を 1 つのプレゼンテーションにまとめる。"""
+    scene_files_folder = output_folder / "files" / scene_name
+    scene_files_folder.mkdir(parents=True, exist_ok=True)
+
+    presentations = [PresentationConfig.from_file(path) for path in segments]
+    slides = []
+    for presentation in presentations:
+        for slide_config in presentation.slides:
+            file = scene_files_folder / slide_config.file.name
+            rev_file = scene_files_folder / slide_config.rev_file.name
+            shutil.copy(slide_config.file, file)
+            if rev_file != file:
+                shutil.copy(slide_config.rev_file, rev_file)
+            slides.append(slide_config.model_copy(update={"file": file, "rev_file": rev_file}))
+
+    slide_path = output_folder / f"{scene_name}.json"
+    PresentationConfig(
+        slides=slides,
+        resolution=presentations[0].resolution,
+        background_color=presentations[0].background_color,
+    ).to_file(slide_path)
+    return slide_path
+
+
+def render_parallel(
+    file: Path,
+    scene_name: str,
+    jobs: int | None = None,
+    quality: str = "high_quality",
+    output_folder: Path = FOLDER_PATH,
+) -> Path:
+    n_slides = len(load_scene_class(file, scene_name).slide_methods())
+    work_folder = (output_folder / ".parallel" / scene_name).absolute()
+    settings = config.copy()
+
+    # Qt や Cairo の状態を引き継がないよう spawn でプロセスを作る
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                render_segment,
+                file.absolute(),
+                scene_name,
+                index,
+                index,
+                quality,
+                work_folder / f"{index:03}",
+                settings,
+            )
+            for index in range(1, n_slides + 1)
+        ]
+        segments = [future.result() for future in futures]
+
+    slide_path = stitch_segments(scene_name, segments, output_folder)
+    logger.info(f"Stitched {n_slides} slides into '{slide_path.absolute()}'")
+    return slide_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", type=Path)
+    parser.add_argument("scene")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="h")
+    parser.add_argument("--folder", type=Path, default=FOLDER_PATH)
+    parser.add_argument("--media_dir", type=Path)
+    parser.add_argument("--renderer", choices=["cairo", "opengl"])
+    parser.add_argument("--disable_caching", action="store_true")
+    parser.add_argument("--flush_cache", action="store_true")
+    args = parser.parse_args()
+
+    # manim.cfg の値を上書きし、各プロセスに渡す設定に載せる
+    if args.media_dir:
+        config.media_dir = args.media_dir
+    if args.renderer:
+        config.renderer = args.renderer
+    if args.disable_caching:
+        config.disable_caching = True
+    if args.flush_cache:
+        config.flush_cache = True
+
+    render_parallel(
+        args.file,
+        args.scene,
+        jobs=args.jobs,
+        quality=QUALITY_FLAGS[args.quality],
+        output_folder=args.folder,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+レンダリング時間のプロファイラー。
+
+``manim-slides render`` の時間が Text の生成・アニメーションの補間・Cairo の
+ラスタライズ・動画のエンコードのどこに使われているかを、``next_slide()`` の区間と
+``self.play`` の呼び出し位置（file:line）ごとに集計する。結果は flamegraph.pl や
+speedscope で読める折りたたみ形式（``media/profile/<Scene>.folded``）と、
+時間順の表（``media/profile/<Scene>.txt``）に書き出す。
+
+    SLIDEKIT_PROFILE=1 uv run manim-slides render presentation.py ClaudeCodeManimSlides
+
+    # tracemalloc でメモリ確保量も計測する（遅くなる）
+    SLIDEKIT_PROFILE=alloc uv run manim-slides render presentation.py ClaudeCodeManimSlides
+
+    flamegraph.pl media/profile/ClaudeCodeManimSlides.folded > profile.svg
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import manim
+import manim_slides
+from manim import MarkupText, Text, config, logger
+from manim.renderer import cairo_renderer
+
+from .incremental import env_flag
+
+# 計測する処理。play の残りは setup、play の外は construct として扱う
+PHASES = ("text", "hash", "interpolate", "rasterize", "encode")
+
+# 呼び出し位置を探すときに飛ばすパッケージ
+_LIBRARY_DIRS = tuple(
+    str(Path(module.__file__).parent) + os.sep for module in (manim, manim_slides)
+) + (str(Path(__file__).parent) + os.sep,)
+
+CONSTRUCT = "(construct)"
+POSTPROCESS = -1
+
+
+@dataclass
+class ProfileEntry:
+    """1 つの区間・呼び出し位置の集計。``alloc`` は呼び出しごとの最大使用量の増分の合計。"""
+
+    calls: int = 0
+    wall: float = 0.0
+    frames: int = 0
+    alloc: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+
+    def breakdown(self, rest: str) -> dict[str, float]:
+        """計測した処理ごとの時間。どれにも入らない時間は ``rest`` にまとめる。"""
+        phases = dict(self.phases)
+        phases[rest] = max(self.wall - sum(self.phases.values()), 0.0)
+        return phases
+
+
+def _rest(segment: int, site: str) -> str:
+    if segment == POSTPROCESS:
+        return "postprocess"
+    return "construct" if site == CONSTRUCT else "setup"
+
+
+def call_site() -> tuple[str, str]:
+    """ライブラリの外で最初に見つかった呼び出し元の ``file:line`` と関数名を返す。"""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_LIBRARY_DIRS):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>", ""
+    filename = frame.f_code.co_filename
+    try:
+        filename = os.path.relpath(filename)
+    except ValueError:
+        pass
+    return f"{filename}:{frame.f_lineno}", frame.f_code.co_name
+
+
+class RenderProfiler:
+    """
+    レンダリング時間を区間と ``self.play`` の呼び出し位置ごとに集計する Scene 用ミックスイン。
+
+    計測のための差し替えはレンダリング中だけ有効で、無効なときは何もしない。
+    他のミックスインの処理も計測できるよう、基底クラスの先頭に置く。
+
+    :cvar profile: プロファイルを取る。環境変数 ``SLIDEKIT_PROFILE=1`` でも有効になる。
+    :cvar profile_allocations: tracemalloc でメモリ確保量も計測する。
+        ``SLIDEKIT_PROFILE=alloc`` で有効になる。
+    """
+
+    profile: bool = env_flag("SLIDEKIT_PROFILE")
+    profile_allocations: bool = os.environ.get("SLIDEKIT_PROFILE", "").lower() == "alloc"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._profile_entries: dict[tuple[int, str], ProfileEntry] = {}
+        self._profile_labels: dict[int, str] = {}
+        self._profile_segment = 0
+        self._profile_entry = self._profile_entry_for(0, CONSTRUCT)
+        self._profile_children: list[float] = []
+        self._profile_mark = 0.0
+        self._profile_memory = 0
+        self._profile_slide_names: set[str] = set()
+
+    @property
+    def profile_path(self) -> Path:
+        name = str(self)
+        slide_range = getattr(self, "slide_range", None)
+        if slide_range is not None:
+            # 並列レンダリングではプロセスごとに別のファイルにする
+            name += f"_{slide_range[0]}-{slide_range[1]}"
+        return Path(config.media_dir) / "profile" / name
+
+    def _profile_entry_for(self, segment: int, site: str) -> ProfileEntry:
+        return self._profile_entries.setdefault((segment, site), ProfileEntry())
+
+    def _charge(self, entry: ProfileEntry) -> None:
+        """前回の区切りからの時間とメモリを ``entry`` に加える。"""
+        now = time.perf_counter()
+        entry.wall += now - self._profile_mark
+        self._profile_mark = now
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            entry.alloc += max(peak - self._profile_memory, 0)
+            tracemalloc.reset_peak()
+            self._profile_memory = current
+
+    def _section(self, entry: ProfileEntry, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        self._charge(self._profile_entry)
+        previous, self._profile_entry = self._profile_entry, entry
+        try:
+            return function(*args, **kwargs)
+        finally:
+            entry.calls += 1
+            self._charge(entry)
+            self._profile_entry = previous
+
+    @contextmanager
+    def _measure(self, phase: str) -> Iterator[None]:
+        # 入れ子になった処理の時間は内側だけに数える
+        start = time.perf_counter()
+        self._profile_children.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._profile_children.pop()
+            if self._profile_children:
+                self._profile_children[-1] += elapsed
+            phases = self._profile_entry.phases
+            phases[phase] = phases.get(phase, 0.0) + elapsed - children
+
+    def _timed(self, phase: str, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self._measure(phase):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    def _counted_write_frame(self, write_frame: Callable) -> Callable:
+        @functools.wraps(write_frame)
+        def wrapper(frame_or_renderer: Any, num_frames: int = 1) -> None:
+            self._profile_entry.frames += num_frames
+            with self._measure("encode"):
+                write_frame(frame_or_renderer, num_frames)
+
+        return wrapper
+
+    def next_slide(self, *args: Any, **kwargs: Any) -> None:
+        if self.profile:
+            self._charge(self._profile_entry)
+            self._profile_segment += 1
+            self._profile_entry = self._profile_entry_for(self._profile_segment, CONSTRUCT)
+        super().next_slide(*args, **kwargs)
+
+    def play(self, *args: Any, **kwargs: Any) -> None:
+        if not self.profile:
+            return super().play(*args, **kwargs)
+        site, function_name = call_site()
+        if function_name in self._profile_slide_names:
+            self._profile_labels.setdefault(self._profile_segment, function_name)
+        entry = self._profile_entry_for(self._profile_segment, site)
+        self._section(entry, super().play, *args, **kwargs)
+
+    def update_to_time(self, t: float) -> None:
+        if not self.profile:
+            return super().update_to_time(t)
+        with self._measure("interpolate"):
+            super().update_to_time(t)
+
+    def _save_slides(self, *args: Any, **kwargs: Any) -> None:
+        if not self.profile:
+            return super()._save_slides(*args, **kwargs)
+        entry = self._profile_entry_for(POSTPROCESS, "(save slides)")
+        self._section(entry, super()._save_slides, *args, **kwargs)
+
+    def render(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.profile:
+            return super().render(*args, **kwargs)
+
+        self._profile_slide_names = {
+            method.__name__ for method in getattr(self, "slide_methods", list)()
+        }
+        renderer = self.renderer
+        file_writer = renderer.file_writer
+        patches = [
+            (renderer.camera, "capture_mobjects", self._timed("rasterize", renderer.camera.capture_mobjects)),
+            (file_writer, "write_frame", self._counted_write_frame(file_writer.write_frame)),
+            (file_writer, "end_animation", self._timed("encode", file_writer.end_animation)),
+            (
+                renderer,
+                "scene_finished",
+                functools.partial(
+                    self._section,
+                    self._profile_entry_for(POSTPROCESS, "(combine partial movies)"),
+                    renderer.scene_finished,
+                ),
+            ),
+            (
+                cairo_renderer,
+                "get_hash_from_play_call",
+                self._timed("hash", cairo_renderer.get_hash_from_play_call),
+            ),
+        ]
+        for cls in (Text, MarkupText):
+            patches.append((cls, "__init__", self._timed("text", cls.__init__)))
+        originals = [(target, name, vars(target).get(name)) for target, name, _ in patches]
+        for target, name, wrapper in patches:
+            setattr(target, name, wrapper)
+
+        if self.profile_allocations:
+            tracemalloc.start()
+            self._profile_memory = tracemalloc.get_traced_memory()[0]
+        self._profile_mark = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self._charge(self._profile_entry)
+            if self.profile_allocations:
+                tracemalloc.stop()
+            for target, name, original in originals:
+                if original is None:
+                    delattr(target, name)
+                else:
+                    setattr(target, name, original)
+            self.write_profile()
+
+    def _segment_label(self, segment: int) -> str:
+        if segment == POSTPROCESS:
+            return "postprocess"
+        if segment == 0:
+            return "00 setup"
+        return f"{segment:02d} {self._profile_labels.get(segment, 'slide')}"
+
+    def write_profile(self) -> None:
+        """折りたたみ形式と表を ``profile_path`` に書き出し、表をログに出す。"""
+        path = self.profile_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        folded = []
+        for (segment, site), entry in self._profile_entries.items():
+            for phase, seconds in entry.breakdown(_rest(segment, site)).items():
+                microseconds = round(seconds * 1e6)
+                if microseconds > 0:
+                    stack = ";".join((str(self), self._segment_label(segment), site, phase))
+                    folded.append(f"{stack} {microseconds}")
+        path.with_suffix(".folded").write_text("\n".join(folded) + "\n", encoding="utf-8")
+
+        table = self.format_profile()
+        path.with_suffix(".txt").write_text(table, encoding="utf-8")
+        logger.info(f"Render profile written to '{path.with_suffix('.folded')}' and '.txt'\n{table}")
+
+    def format_profile(self, top: int = 20) -> str:
+        """スライドごとと呼び出し位置ごとの集計を、時間の長い順に並べた表にする。"""
+        entries = self._profile_entries
+        total = sum(entry.wall for entry in entries.values()) or 1.0
+        alloc = self.profile_allocations
+
+        slides: dict[int, ProfileEntry] = {}
+        for (segment, site), entry in entries.items():
+            summary = slides.setdefault(segment, ProfileEntry())
+            summary.wall += entry.wall
+            summary.frames += entry.frames
+            summary.alloc += entry.alloc
+            for phase, seconds in entry.breakdown(_rest(segment, site)).items():
+                summary.phases[phase] = summary.phases.get(phase, 0.0) + seconds
+
+        lines = [
+            f"{self}: {total:.2f}s, {sum(e.frames for e in slides.values())} frames",
+            "",
+            f"{'slide':<36} {'wall s':>8} {'share':>6} {'frames':>7}"
+            + (f" {'alloc MiB':>10}" if alloc else "")
+            + "  hottest",
+        ]
+        for segment, summary in sorted(slides.items(), key=lambda item: -item[1].wall):
+            hottest = max(summary.phases, key=summary.phases.get)
+            lines.append(
+                f"{self._segment_label(segment):<36.36} {summary.wall:>8.2f} "
+                f"{summary.wall / total:>6.1%} {summary.frames:>7}"
+                + (f" {summary.alloc / 2**20:>10.1f}" if alloc else "")
+                + f"  {hottest} {summary.phases[hottest]:.2f}s"
+            )
+
+        columns = (*PHASES, "setup")
+        lines += [
+            "",
+            f"{'call site':<36} {'slide':<24} {'calls':>5} {'wall s':>8} {'frames':>7} {'ms/frame':>8}"
+            + (f" {'alloc MiB':>10}" if alloc else "")
+            + "".join(f" {phase:>11}" for phase in columns),
+        ]
+        calls = [
+            (key, entry) for key, entry in entries.items() if key[1] != CONSTRUCT and key[0] != POSTPROCESS
+        ]
+        for (segment, site), entry in sorted(calls, key=lambda item: -item[1].wall)[:top]:
+            phases = entry.breakdown("setup")
+            per_frame = f"{entry.wall / entry.frames * 1e3:>8.1f}" if entry.frames else f"{'-':>8}"
+            lines.append(
+                f"{site:<36.36} {self._segment_label(segment):<24.24} {entry.calls:>5} "
+                f"{entry.wall:>8.2f} {entry.frames:>7} {per_frame}"
+                + (f" {entry.alloc / 2**20:>10.1f}" if alloc else "")
+                + "".join(f" {phases.get(phase, 0.0):>11.2f}" for phase in columns)
+            )
+        return "\n".join(lines) + "\n"
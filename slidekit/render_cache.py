@@ -0,0 +1,255 @@
+"""
+マシン間で共有できるレンダリングキャッシュ。
+
+manim の部分動画（``self.play`` 1 回分）と、インクリメンタルレンダリングの
+スライド動画を、内容から決まるキーで保存・取得する。キーには manim の
+アニメーションハッシュに加えて manim のバージョンと品質設定を含める。
+保存先は環境変数 ``SLIDEKIT_RENDER_CACHE`` で指定する。
+
+    # ローカルディレクトリ
+    SLIDEKIT_RENDER_CACHE=~/.cache/slidekit uv run manim-slides render presentation.py ClaudeCodeManimSlides
+
+    # HTTP（GET / PUT が使えるサーバー。S3 互換ストレージなど）
+    SLIDEKIT_RENDER_CACHE=http://cache.local:8000 uv run manim-slides render ...
+
+    # 手元のディレクトリを HTTP で公開する（デフォルトは 127.0.0.1 だけで待ち受ける）
+    uv run python -m slidekit.render_cache serve ~/.cache/slidekit --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.server
+import os
+import shutil
+import tempfile
+import urllib.error
+import urllib.request
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import manim
+from manim import config, logger
+
+
+def digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class RenderCache:
+    """キャッシュのバックエンド。``name`` は ``partial/<key>.mp4`` のような相対パス。"""
+
+    def get(self, name: str, dst: Path) -> bool:
+        """``name`` があれば ``dst`` に書き出して ``True`` を返す。"""
+        raise NotImplementedError
+
+    def put(self, name: str, src: Path) -> None:
+        raise NotImplementedError
+
+
+def _atomic_copy(src: Path, dst: Path) -> None:
+    # 他のプロセスが書きかけのファイルを読まないよう、一時ファイルから置き換える
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=dst.parent, delete=False) as f:
+        tmp = Path(f.name)
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class LocalRenderCache(RenderCache):
+    def __init__(self, root: Path):
+        self.root = Path(root).expanduser()
+
+    def get(self, name: str, dst: Path) -> bool:
+        path = self.root / name
+        if not path.exists():
+            return False
+        _atomic_copy(path, dst)
+        return True
+
+    def put(self, name: str, src: Path) -> None:
+        path = self.root / name
+        if not path.exists():
+            _atomic_copy(src, path)
+
+
+class HTTPRenderCache(RenderCache):
+    """``GET`` / ``PUT <base_url>/<name>`` で読み書きするバックエンド。"""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, name: str, dst: Path) -> bool:
+        tmp = None
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/{name}", timeout=self.timeout) as response:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile(dir=dst.parent, delete=False) as f:
+                    tmp = Path(f.name)
+                    shutil.copyfileobj(response, f)
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                logger.warning(f"Render cache: GET {name} failed ({e.code})")
+            return False
+        except OSError as e:
+            # 転送の途中で失敗した一時ファイルを部分動画のディレクトリに残さない
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+            logger.warning(f"Render cache: GET {name} failed ({e})")
+            return False
+        os.replace(tmp, dst)
+        return True
+
+    def put(self, name: str, src: Path) -> None:
+        request = urllib.request.Request(
+            f"{self.base_url}/{name}", data=src.read_bytes(), method="PUT"
+        )
+        try:
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+        except OSError as e:
+            logger.warning(f"Render cache: PUT {name} failed ({e})")
+
+
+def cache_from_env() -> RenderCache | None:
+    location = os.environ.get("SLIDEKIT_RENDER_CACHE")
+    if not location:
+        return None
+    if location.startswith(("http://", "https://")):
+        return HTTPRenderCache(location)
+    return LocalRenderCache(Path(location))
+
+
+def render_settings() -> str:
+    """キャッシュキーに含めるレンダラーのバージョンと品質設定。"""
+    return digest(
+        manim.__version__,
+        str(config.renderer),
+        f"{config.pixel_width}x{config.pixel_height}@{config.frame_rate}",
+        config.movie_file_extension,
+        str(config.transparent),
+    )
+
+
+class SharedRenderCache:
+    """
+    manim の部分動画を :class:`RenderCache` と共有する Scene 用ミックスイン。
+
+    ローカルに部分動画がないアニメーションは、レンダリングする前にキャッシュから
+    取得する。今回レンダリングした部分動画はキャッシュに保存する。
+
+    :cvar render_cache: 使用するバックエンド。デフォルトは ``SLIDEKIT_RENDER_CACHE``。
+    """
+
+    render_cache: RenderCache | None = cache_from_env()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_hashes: set[str] = set()
+
+        if self.render_cache is not None:
+            file_writer = self.renderer.file_writer
+            file_writer.is_already_cached = partial(
+                self._is_already_cached, file_writer.is_already_cached
+            )
+
+    def partial_movie_name(self, hash_invocation: str) -> str:
+        key = digest(render_settings(), hash_invocation)
+        return f"partial/{key}{config.movie_file_extension}"
+
+    def _is_already_cached(self, is_cached_locally, hash_invocation: str) -> bool:
+        file_writer = self.renderer.file_writer
+        if is_cached_locally(hash_invocation) or (
+            hasattr(file_writer, "partial_movie_directory")
+            and self.render_cache.get(
+                self.partial_movie_name(hash_invocation),
+                file_writer.partial_movie_directory
+                / f"{hash_invocation}{config.movie_file_extension}",
+            )
+        ):
+            self._cached_hashes.add(hash_invocation)
+            return True
+        return False
+
+    def play(self, *args: Any, **kwargs: Any) -> None:
+        super().play(*args, **kwargs)
+
+        if self.render_cache is None:
+            return
+        hash_invocation = self.renderer.animations_hashes[-1]
+        if hash_invocation is None or hash_invocation in self._cached_hashes:
+            return
+        path = Path(self.renderer.file_writer.partial_movie_files[-1])
+        if path.exists():
+            self.render_cache.put(self.partial_movie_name(hash_invocation), path)
+            self._cached_hashes.add(hash_invocation)
+
+
+class _CacheRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # PUT で受け付ける 1 ファイルの上限（バイト）
+    max_size = 512 * 1024 * 1024
+
+    def do_PUT(self) -> None:
+        try:
+            length = int(self.headers["Content-Length"])
+        except (TypeError, ValueError):
+            self.send_error(411, "Content-Length required")
+            return
+        if not 0 <= length <= self.max_size:
+            self.send_error(413, f"Body must be at most {self.max_size} bytes")
+            return
+        path = Path(self.translate_path(self.path))
+        if self.path.endswith("/") or path.is_dir():
+            self.send_error(400, "Cannot PUT a directory")
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                tmp = Path(f.name)
+                remaining = length
+                while remaining > 0:
+                    chunk = self.rfile.read(min(remaining, 1 << 16))
+                    if not chunk:
+                        raise ConnectionError("Request body ended early")
+                    f.write(chunk)
+                    remaining -= len(chunk)
+        except OSError:
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+            self.send_error(400, "Incomplete request body")
+            return
+        os.replace(tmp, path)
+        self.send_response(201)
+        self.end_headers()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a render cache directory over HTTP.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve = subparsers.add_parser("serve")
+    serve.add_argument("directory", type=Path)
+    serve.add_argument("--bind", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument(
+        "--max-size", type=int, default=_CacheRequestHandler.max_size, help="Max PUT size in bytes."
+    )
+    args = parser.parse_args()
+
+    args.directory.mkdir(parents=True, exist_ok=True)
+    _CacheRequestHandler.max_size = args.max_size
+    handler = partial(_CacheRequestHandler, directory=str(args.directory))
+    with http.server.ThreadingHTTPServer((args.bind, args.port), handler) as server:
+        print(f"Serving render cache {args.directory} on {args.bind}:{args.port}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
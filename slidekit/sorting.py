@@ -0,0 +1,275 @@
+"""
+ソートアルゴリズムの可視化。
+
+値の配列から比較・交換の手順（トレース）を先に計算し、バー・ハイライト・比較
+ラベルは最初に一度だけ作る。トレース全体は 1 つの :class:`SortTraceAnimation` として
+再生し、各フレームでは事前計算した配置表からバーの x 座標とハイライト・ラベルの
+不透明度を決めるだけにする。比較ごとに ``self.play`` を何度も呼ぶ必要はない。
+
+    trace = bubble_sort_trace(values)
+    bars = SortingBars(values, make_bar)
+    self.play(bars.sort_animation(trace, make_label=make_label))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+from manim import (
+    DOWN,
+    YELLOW,
+    Animation,
+    Mobject,
+    SurroundingRectangle,
+    VGroup,
+    linear,
+    smooth,
+)
+
+
+@dataclass(frozen=True)
+class SortStep:
+    """
+    トレースの 1 ステップ。
+
+    :param compare: 比較した 2 つの位置。並べ替えだけのステップでは ``None``。
+    :param values: 比較した 2 つの値。
+    :param order: ステップ後に各位置にある要素の、元の配列でのインデックス。
+    :param moved: このステップで並びが変わったか。
+    """
+
+    compare: tuple[int, int] | None
+    values: tuple[float, float] | None
+    order: tuple[int, ...]
+    moved: bool
+
+
+def bubble_sort_trace(values: Sequence[float]) -> list[SortStep]:
+    vals, order = list(values), list(range(len(values)))
+    steps = []
+    for pass_idx in range(len(vals) - 1):
+        for j in range(len(vals) - 1 - pass_idx):
+            left, right = vals[j], vals[j + 1]
+            moved = left > right
+            if moved:
+                vals[j], vals[j + 1] = right, left
+                order[j], order[j + 1] = order[j + 1], order[j]
+            steps.append(SortStep((j, j + 1), (left, right), tuple(order), moved))
+    return steps
+
+
+def insertion_sort_trace(values: Sequence[float]) -> list[SortStep]:
+    vals, order = list(values), list(range(len(values)))
+    steps = []
+    for i in range(1, len(vals)):
+        for j in range(i, 0, -1):
+            left, right = vals[j - 1], vals[j]
+            moved = left > right
+            if moved:
+                vals[j - 1], vals[j] = right, left
+                order[j - 1], order[j] = order[j], order[j - 1]
+            steps.append(SortStep((j - 1, j), (left, right), tuple(order), moved))
+            if not moved:
+                break
+    return steps
+
+
+def merge_sort_trace(values: Sequence[float]) -> list[SortStep]:
+    """ボトムアップのマージソート。比較はそのまま記録し、並べ替えはマージごとにまとめる。"""
+    vals, order = list(values), list(range(len(values)))
+    n = len(vals)
+    steps = []
+    width = 1
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            mid, hi = lo + width, min(lo + 2 * width, n)
+            i, j = lo, mid
+            merged = []
+            while i < mid and j < hi:
+                steps.append(SortStep((i, j), (vals[i], vals[j]), tuple(order), False))
+                if vals[j] < vals[i]:
+                    merged.append(j)
+                    j += 1
+                else:
+                    merged.append(i)
+                    i += 1
+            merged += list(range(i, mid)) + list(range(j, hi))
+            if merged != list(range(lo, hi)):
+                vals[lo:hi] = [vals[k] for k in merged]
+                order[lo:hi] = [order[k] for k in merged]
+                steps.append(SortStep(None, None, tuple(order), True))
+        width *= 2
+    return steps
+
+
+class SortingBars(VGroup):
+    """
+    並べ替え可能なバーの列。
+
+    :param values: 各バーの値。
+    :param make_bar: 値からバー（ラベル込み）を作る関数。y 座標は呼び出し側で決める。
+    :param spacing: 隣り合うバーの中心の間隔。列全体は x=0 を中心に並ぶ。
+    """
+
+    def __init__(
+        self,
+        values: Sequence[float],
+        make_bar: Callable[[float], Mobject],
+        spacing: float = 1.0,
+        highlight_color=YELLOW,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+
+        self.values = np.asarray(values)
+        self.slots = (np.arange(len(values)) - (len(values) - 1) / 2) * spacing
+        self.order = np.arange(len(values))
+
+        self.items = VGroup()
+        self.highlights = VGroup()
+        for value, x in zip(values, self.slots):
+            bar = make_bar(value).set_x(x)
+            highlight = SurroundingRectangle(bar, color=highlight_color, buff=0.08, corner_radius=0.1)
+            highlight.set_stroke(opacity=0)
+            self.items.add(VGroup(bar, highlight))
+            self.highlights.add(highlight)
+
+        # 比較ラベルを 1 つだけ表示する枠。中身はフレームごとに差し替える
+        self.caption = VGroup()
+        self.add(self.items, self.caption)
+
+    def current_values(self) -> np.ndarray:
+        return self.values[self.order]
+
+    def sort_animation(self, trace: Sequence[SortStep], **kwargs) -> SortTraceAnimation:
+        """``trace`` は :meth:`current_values` から計算したものを渡す。"""
+        return SortTraceAnimation(self, trace, **kwargs)
+
+
+class SortTraceAnimation(Animation):
+    """
+    :class:`SortingBars` にトレース全体を再生させるアニメーション。
+
+    1 ステップは「ハイライト → ラベル表示 → (ハイライトを消して移動 → ラベルを消す)
+    または (ハイライトとラベルを消す) → 間隔」で進む。並べ替えだけのステップは
+    「移動 → 間隔」になる。各フェーズの長さは引数で指定する。
+    """
+
+    def __init__(
+        self,
+        bars: SortingBars,
+        trace: Sequence[SortStep],
+        make_label: Callable[[SortStep], Mobject] | None = None,
+        label_position=DOWN * 3.2,
+        highlight_time: float = 0.4,
+        label_time: float = 0.3,
+        unhighlight_time: float = 0.2,
+        move_time: float = 0.6,
+        pause_time: float = 0.5,
+        **kwargs,
+    ):
+        self.bars = bars
+        self.trace = list(trace)
+
+        # 各ステップのフェーズ表 (名前, 開始時刻, 長さ)
+        self.phases = []
+        t = 0.0
+        for step in self.trace:
+            if step.compare is None:
+                names = [("move", move_time)]
+            elif step.moved:
+                names = [
+                    ("highlight", highlight_time),
+                    ("label", label_time),
+                    ("unhighlight", unhighlight_time),
+                    ("move", move_time),
+                    ("unlabel", label_time),
+                ]
+            else:
+                names = [("highlight", highlight_time), ("label", label_time), ("fade", label_time)]
+            names.append(("pause", pause_time))
+            phases = []
+            for name, duration in names:
+                phases.append((name, t, duration))
+                t += duration
+            self.phases.append(phases)
+        self.step_starts = np.array([phases[0][1] for phases in self.phases])
+        self.total_time = t
+
+        # 各ステップ前後の、元インデックスごとのスロット番号
+        self.orders = np.array([bars.order] + [np.asarray(bars.order)[list(s.order)] for s in self.trace])
+        self.slot_of = np.argsort(self.orders, axis=1)
+
+        # ラベルは同じ文字列を使い回す
+        self.labels: list[Mobject | None] = []
+        cache: dict[tuple, Mobject] = {}
+        for step in self.trace:
+            if make_label is None or step.compare is None:
+                self.labels.append(None)
+                continue
+            key = (step.values, step.moved)
+            if key not in cache:
+                cache[key] = make_label(step).move_to(label_position)
+            self.labels.append(cache[key])
+
+        self.lit: list[Mobject] = []
+        kwargs.setdefault("run_time", self.total_time)
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(bars, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self.trace:
+            return
+        t = alpha * self.total_time
+        index = int(np.clip(np.searchsorted(self.step_starts, t, side="right") - 1, 0, len(self.trace) - 1))
+        step = self.trace[index]
+
+        highlight, label, move = 0.0, 0.0, 0.0
+        for name, start, duration in self.phases[index]:
+            if t < start:
+                break
+            p = 1.0 if duration == 0 else min((t - start) / duration, 1.0)
+            if name == "highlight":
+                highlight = p
+            elif name == "label":
+                label = p
+            elif name == "unhighlight":
+                highlight = 1 - p
+            elif name == "move":
+                move = smooth(p)
+            elif name in ("unlabel", "fade"):
+                label = 1 - p
+                highlight = 0.0 if name == "unlabel" else 1 - p
+
+        # バーの位置: ステップ前後のスロットを一括で補間する
+        start_slots = self.bars.slots[self.slot_of[index]]
+        end_slots = self.bars.slots[self.slot_of[index + 1]]
+        xs = start_slots + (end_slots - start_slots) * move
+        for item, x in zip(self.bars.items, xs):
+            item.set_x(x)
+
+        for mob in self.lit:
+            mob.set_stroke(opacity=0)
+        self.lit = []
+        if step.compare is not None and highlight > 0:
+            for position in step.compare:
+                mob = self.bars.highlights[self.orders[index][position]]
+                mob.set_stroke(opacity=highlight)
+                self.lit.append(mob)
+
+        current = self.labels[index]
+        if current is not None and label > 0:
+            current.set_opacity(label)
+            self.bars.caption.submobjects = [current]
+        else:
+            self.bars.caption.submobjects = []
+
+    def finish(self) -> None:
+        super().finish()
+        self.bars.order = self.orders[-1]
+        self.bars.caption.submobjects = []
+        for mob in self.lit:
+            mob.set_stroke(opacity=0)
+        self.lit = []
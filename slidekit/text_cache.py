@@ -0,0 +1,66 @@
+"""
+Text モブジェクトのキャッシュ。
+
+``Text(...)`` は呼び出しのたびに Pango でのシェーピングと SVG のパースを行う。
+同じ文字列・フォント・サイズ・ウェイト・色の組み合わせは一度だけ生成し、
+以降はそのディープコピーを返す。キャッシュはプロセス全体で共有し、LRU で
+``TEXT_CACHE_SIZE`` 件までに抑える。
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from manim import Text
+
+TEXT_CACHE_SIZE = 512
+
+
+class TextCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_cache: OrderedDict[tuple, Text] = OrderedDict()
+_hits = 0
+_misses = 0
+
+
+def _freeze(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def cached_text(text: str, **kwargs: Any) -> Text:
+    """``Text(text, **kwargs)`` と同じモブジェクトを返す。2回目以降はコピーで済ませる。"""
+    global _hits, _misses
+
+    key = (text, tuple(sorted((name, _freeze(value)) for name, value in kwargs.items())))
+    master = _cache.get(key)
+    if master is None:
+        _misses += 1
+        master = Text(text, **kwargs)
+        _cache[key] = master
+        if len(_cache) > TEXT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _hits += 1
+        _cache.move_to_end(key)
+    return master.copy()
+
+
+def text_cache_info() -> TextCacheInfo:
+    return TextCacheInfo(_hits, _misses, TEXT_CACHE_SIZE, len(_cache))
+
+
+def clear_text_cache() -> None:
+    global _hits, _misses
+
+    _cache.clear()
+    _hits = _misses = 0